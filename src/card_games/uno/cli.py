@@ -4,9 +4,11 @@ Command-line interface for Uno game with Rich formatting.
 This module provides a beautiful text-based interface for playing Uno games.
 """
 
-from .game import UnoGame, Card, Color, CardType
+import copy
+
+from .game import UnoGame, Card, Color, CardType, _COLOR_ORDER, _TYPE_ORDER
 from typing import List, Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, IntPrompt
@@ -17,6 +19,168 @@ from rich import box
 from rich.style import Style
 
 
+# ASCII art patterns for numbers 0-9 (5 rows high, calculator style)
+_DIGIT_PATTERNS = {
+    0: [
+        " ███ ",
+        "█   █",
+        "█   █",
+        "█   █",
+        " ███ "
+    ],
+    1: [
+        "  █  ",
+        " ██  ",
+        "  █  ",
+        "  █  ",
+        " ███ "
+    ],
+    2: [
+        " ███ ",
+        "    █",
+        " ███ ",
+        "█    ",
+        "█████"
+    ],
+    3: [
+        " ███ ",
+        "    █",
+        " ███ ",
+        "    █",
+        " ███ "
+    ],
+    4: [
+        "█   █",
+        "█   █",
+        "█████",
+        "    █",
+        "    █"
+    ],
+    5: [
+        "█████",
+        "█    ",
+        "████ ",
+        "    █",
+        "████ "
+    ],
+    6: [
+        " ███ ",
+        "█    ",
+        "████ ",
+        "█   █",
+        " ███ "
+    ],
+    7: [
+        "█████",
+        "    █",
+        "   █ ",
+        "  █  ",
+        " █   "
+    ],
+    8: [
+        " ███ ",
+        "█   █",
+        " ███ ",
+        "█   █",
+        " ███ "
+    ],
+    9: [
+        " ███ ",
+        "█   █",
+        " ████",
+        "    █",
+        " ███ "
+    ]
+}
+
+# ASCII art patterns for UNO symbols (5 rows high)
+_SYMBOL_PATTERNS = {
+    "+2": [
+        "     ███ ",
+        "  █     █",
+        " ███ ███ ",
+        "  █  █   ",
+        "    ████ "
+    ],
+    "+4": [
+        "    █   █",
+        " █  █   █",
+        "███ █████",
+        " █      █",
+        "        █"
+    ],
+    "<-": [
+        "   █     ",
+        "  ██     ",
+        " ███████ ",
+        "  ██     ",
+        "   █     "
+    ],
+    "!": [
+        "  ███  ",
+        "  ███  ",
+        "  ███  ",
+        "       ",
+        "  ███  "
+    ],
+    "?": [
+        "  ███ ",
+        " █   █",
+        "   ██ ",
+        "      ",
+        "   ██ "
+    ]
+}
+
+_FALLBACK_PATTERN = [" ███ ", "█   █", "█   █", "█   █", " ███ "]
+
+# One Text per digit/symbol, joined and styled at import instead of per call -
+# callers receive copies, so these originals are never mutated
+_DIGIT_TEXTS = {n: Text("\n".join(p), style="bold white") for n, p in _DIGIT_PATTERNS.items()}
+_SYMBOL_TEXTS = {s: Text("\n".join(p), style="bold white") for s, p in _SYMBOL_PATTERNS.items()}
+_FALLBACK_TEXT = Text("\n".join(_FALLBACK_PATTERN), style="bold white")
+_MULTI_DIGIT_TEXTS = {}  # Lazily assembled multi-digit faces
+
+# Type ordinals inside the packed Card.sort_key, used by the flat-array
+# hand scans in _summarize_hand and _render_player_hand. WILD and
+# WILD_DRAW sort last, so "is a wild type" is an ordinal >= _WILD_ORD
+_NUMBER_ORD = _TYPE_ORDER[CardType.NUMBER]
+_DRAW_TWO_ORD = _TYPE_ORDER[CardType.DRAW_TWO]
+_WILD_ORD = _TYPE_ORDER[CardType.WILD]
+
+# Colors a player may pick for a wild card, in menu order
+_COLOR_CHOICES = (Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW)
+
+# Shared blank line between hand rows - never written to, so one
+# instance serves every render
+_ROW_SPACER = Text()
+
+# Card type -> display symbol for the special cards. One dict lookup replaces
+# the old str(card).upper() + substring-scan chains in the render paths
+_TYPE_TO_SYMBOL = {
+    CardType.DRAW_TWO: "+2",
+    CardType.REVERSE: "<-",
+    CardType.SKIP: "!",
+    CardType.WILD: "?",
+    CardType.WILD_DRAW: "+4",
+}
+
+
+class _HandView:
+    """Per-turn summary of a hand, built in one pass by _summarize_hand.
+
+    __slots__ keeps the per-turn allocation small - one of these is built
+    every turn and thrown away."""
+
+    __slots__ = ("sorted_cards", "sorted_to_original", "has_draw_two", "sorted_keys")
+
+    def __init__(self, sorted_cards, sorted_to_original, has_draw_two, sorted_keys):
+        self.sorted_cards = sorted_cards
+        self.sorted_to_original = sorted_to_original
+        self.has_draw_two = has_draw_two
+        self.sorted_keys = sorted_keys  # Packed sort keys, in display order
+
+
 class UnoCLI:
     """Command-line interface for Uno game with Rich formatting."""
     
@@ -25,7 +189,32 @@ class UnoCLI:
         self.preset_players = None  # Allow preset number of players
         self.console = Console()
         self._current_sorted_hand = []  # Store sorted hand for card selection
-        
+        self._current_sorted_to_original = []  # Display position -> hand index
+        # Flat ordinal mirrors of the sorted hand (see _render_player_hand)
+        self._hand_colors = []
+        self._hand_types = []
+        self._hand_values = []
+        self._last_hand_summary = None  # (hand fingerprint, _HandView)
+
+        # Rendered-card caches - a deck has only 54 distinct faces and a
+        # handful of border styles, and the Rich objects are never mutated
+        # after construction, so each face is built at most once per process
+        self._panel_cache = {}  # {(type, color, value, style_prefix): Panel}
+        self._display_text_cache = {}  # {(type, color, value): Text}
+        self._card_panel_cache = {}  # {(type, color, value, playable): Panel}
+        self._hand_panel_cache = {}  # {(type, color, value, playable): framed hand Panel}
+        self._turn_panel_cache = {}  # {player_name: Panel}
+        self._warning_panel_cache = {}  # {(forced_draw, has_draw_two): Panel}
+        self._gs_cache = {}  # {"top"/"draw"/"others": (key, Panel)} - see _render_game_state
+        self._gs_columns = None  # (sub-panel identity tuple, Columns)
+        self._other_players_table = None  # ((current player, counts), Table)
+        self._player_prefixes = {}  # {player_name: Text("name: ")} - names are fixed per game
+
+        # "[1]".."[N]" labels shown above hand cards; never mutated, so one
+        # Text per index is shared across renders (extended on demand for
+        # oversized hands)
+        self._index_labels = [Text(f"[{i}]", style="bold white", justify="center") for i in range(32)]
+
         # Color mapping for cards
         self.color_map = {
             Color.RED: "red",
@@ -35,202 +224,89 @@ class UnoCLI:
             Color.WILD: "magenta"
         }
 
+        # Derived per-color lookups, built once - render paths do a plain
+        # dict hit instead of .value.lower() / color_map.get() per card
+        self._color_name = {c: c.value.lower() for c in Color}
+        self._bg_for = {c: self.color_map[c] for c in Color}
+        self._panel_style = {
+            (playable, c): f"{'green' if playable else 'red'} on {self._bg_for[c]}"
+            for playable in (True, False)
+            for c in Color
+        }
+
+        # The wild-card color menu is completely static, so the table is
+        # built once and reprinted as-is
+        self._color_choice_table = Table(title="🌈 Choose a Color", style="bold")
+        self._color_choice_table.add_column("Number", justify="center", style="dim")
+        self._color_choice_table.add_column("Color", justify="center")
+        for i, color in enumerate(_COLOR_CHOICES):
+            color_text = Text(color.value.capitalize(), style=f"bold {self.color_map[color]}")
+            self._color_choice_table.add_row(str(i + 1), color_text)
+        self._color_choice_ansi = None  # Rendered menu, captured on first display
+
     def _create_full_card_panel(self, card: Card, style_prefix: str = "green") -> Panel:
-        """Create a full-sized card panel with ASCII art."""
-        card_content = Text()
-        
-        # Format card value/type with ASCII art
-        if card.type == CardType.NUMBER:
-            ascii_number = self._create_ascii_number(card.value)
-            card_content = ascii_number
-            if card.color != Color.WILD:
-                color_name = card.color.value.lower()
-                card_content.append(f"\n{color_name}", style="bold white")
-        elif card.type == CardType.WILD:
-            ascii_symbol = self._create_ascii_symbol("?")
-            card_content = ascii_symbol
-        elif card.type == CardType.WILD_DRAW:
-            ascii_symbol = self._create_ascii_symbol("+4")
-            card_content = ascii_symbol
+        """Create a full-sized card panel with ASCII art.
+
+        The panel is a pure function of the card face and border style, so it
+        is memoized - repeated displays of the same face reuse one Panel."""
+        key = (card.type, card.color, card.value, style_prefix)
+        cached = self._panel_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Fast path first: plain number cards make up roughly 70% of the
+        # deck, so they skip the special-card dispatch entirely (enum
+        # members are singletons, so the identity check is a pointer
+        # comparison)
+        if card.type is CardType.NUMBER:
+            card_content = self._create_ascii_number(card.value)
         else:
-            card_value = str(card).upper()
-            if card.color != Color.WILD:
-                color_name = card.color.value.lower()
-                if "DRAW TWO" in card_value:
-                    ascii_symbol = self._create_ascii_symbol("+2")
-                    card_content = ascii_symbol
-                    card_content.append(f"\n{color_name}", style="bold white")
-                elif "REVERSE" in card_value:
-                    ascii_symbol = self._create_ascii_symbol("<-")
-                    card_content = ascii_symbol
-                    card_content.append(f"\n{color_name}", style="bold white")
-                elif "SKIP" in card_value:
-                    ascii_symbol = self._create_ascii_symbol("!")
-                    card_content = ascii_symbol
-                    card_content.append(f"\n{color_name}", style="bold white")
-                else:
-                    card_content.append(f"\n{card_value}\n\n{color_name}", style="bold white")
+            symbol = _TYPE_TO_SYMBOL.get(card.type)
+            if symbol is not None:
+                card_content = self._create_ascii_symbol(symbol)
             else:
-                if "DRAW TWO" in card_value:
-                    ascii_symbol = self._create_ascii_symbol("+2")
-                    card_content = ascii_symbol
-                elif "REVERSE" in card_value:
-                    ascii_symbol = self._create_ascii_symbol("<-")
-                    card_content = ascii_symbol
-                elif "SKIP" in card_value:
-                    ascii_symbol = self._create_ascii_symbol("!")
-                    card_content = ascii_symbol
-                else:
-                    card_content.append(f"\n{card_value}\n", style="bold white")
-        
-        # Determine background color
-        if card.color != Color.WILD:
-            background_color = self.color_map.get(card.color, "white")
-        else:
-            background_color = "magenta"
-        
+                card_content = Text()
+                card_content.append(f"\n{str(card).upper()}\n", style="bold white")
+        if card.color is not Color.WILD:
+            card_content.append(f"\n{self._color_name[card.color]}", style="bold white")
+
+        background_color = self._bg_for[card.color]
+
         # Create card panel
-        return Panel(
+        panel = Panel(
             Align.center(card_content),
             style=f"{style_prefix} on {background_color}",
             width=14,
             height=8
         )
+        self._panel_cache[key] = panel
+        return panel
 
     def _create_ascii_number(self, number: int) -> Text:
-        """Create ASCII art representation of a number for card values."""
-        # ASCII art patterns for numbers 0-9 (5 rows high, calculator style)
-        ascii_patterns = {
-            0: [
-                " ███ ",
-                "█   █",
-                "█   █",
-                "█   █",
-                " ███ "
-            ],
-            1: [
-                "  █  ",
-                " ██  ",
-                "  █  ",
-                "  █  ",
-                " ███ "
-            ],
-            2: [
-                " ███ ",
-                "    █",
-                " ███ ",
-                "█    ",
-                "█████"
-            ],
-            3: [
-                " ███ ",
-                "    █",
-                " ███ ",
-                "    █",
-                " ███ "
-            ],
-            4: [
-                "█   █",
-                "█   █",
-                "█████",
-                "    █",
-                "    █"
-            ],
-            5: [
-                "█████",
-                "█    ",
-                "████ ",
-                "    █",
-                "████ "
-            ],
-            6: [
-                " ███ ",
-                "█    ",
-                "████ ",
-                "█   █",
-                " ███ "
-            ],
-            7: [
-                "█████",
-                "    █",
-                "   █ ",
-                "  █  ",
-                " █   "
-            ],
-            8: [
-                " ███ ",
-                "█   █",
-                " ███ ",
-                "█   █",
-                " ███ "
-            ],
-            9: [
-                " ███ ",
-                "█   █",
-                " ████",
-                "    █",
-                " ███ "
-            ]
-        }
-        
+        """Create ASCII art representation of a number for card values.
+
+        Returns a copy of the precomputed digit Text - callers append the
+        color name to the result, and the cached originals must stay clean."""
         if number < 10:
-            pattern = ascii_patterns.get(number, [" ███ ", "█   █", "█   █", "█   █", " ███ "])
-            return Text("\n".join(pattern), style="bold white")
-        else:
-            # For multi-digit numbers, combine patterns
-            digits = [int(d) for d in str(number)]
-            lines = ["", "", "", "", ""]
-            for i, digit in enumerate(digits):
-                digit_pattern = ascii_patterns.get(digit, [" ███ ", "█   █", "█   █", "█   █", " ███ "])
-                for line_idx in range(5):
-                    if i > 0:  # Add space between digits
-                        lines[line_idx] += " "
-                    lines[line_idx] += digit_pattern[line_idx]
-            return Text("\n".join(lines), style="bold white")
+            return _DIGIT_TEXTS.get(number, _FALLBACK_TEXT).copy()
+
+        # For multi-digit numbers (unused by a standard deck), combine
+        # patterns lazily and cache the assembled Text. Each row is built
+        # with a single join - digits separated by one space - instead of
+        # cumulative string concatenation
+        cached = _MULTI_DIGIT_TEXTS.get(number)
+        if cached is None:
+            patterns = [_DIGIT_PATTERNS.get(int(d), _FALLBACK_PATTERN) for d in str(number)]
+            lines = [" ".join(p[row] for p in patterns) for row in range(5)]
+            cached = _MULTI_DIGIT_TEXTS[number] = Text("\n".join(lines), style="bold white")
+        return cached.copy()
 
     def _create_ascii_symbol(self, symbol: str) -> Text:
-        """Create ASCII art representation of UNO card symbols."""
-        # ASCII art patterns for UNO symbols (5 rows high)
-        symbol_patterns = {
-            "+2": [
-                "     ███ ",
-                "  █     █",
-                " ███ ███ ",
-                "  █  █   ",
-                "    ████ "
-            ],
-            "+4": [
-                "    █   █",
-                " █  █   █",
-                "███ █████",
-                " █      █",
-                "        █"
-            ],
-            "<-": [
-                "   █     ",
-                "  ██     ",
-                " ███████ ",
-                "  ██     ",
-                "   █     "
-            ],
-            "!": [
-                "  ███  ",
-                "  ███  ",
-                "  ███  ",
-                "       ",
-                "  ███  "
-            ],
-            "?": [
-                "  ███ ",
-                " █   █",
-                "   ██ ",
-                "      ",
-                "   ██ "
-            ]
-        }
-        
-        pattern = symbol_patterns.get(symbol, [" ███ ", "█   █", "█   █", "█   █", " ███ "])
-        return Text("\n".join(pattern), style="bold white")
+        """Create ASCII art representation of UNO card symbols.
+
+        Returns a copy of the precomputed symbol Text for the same reason as
+        _create_ascii_number."""
+        return _SYMBOL_TEXTS.get(symbol, _FALLBACK_TEXT).copy()
 
     def play(self):
         """Start and play a game of Uno."""
@@ -270,35 +346,42 @@ class UnoCLI:
         self.console.print(winner_panel)
 
     def _format_card_display(self, card: Card) -> Text:
-        """Format a card for rich display with colors."""
+        """Format a card for rich display with colors.
+
+        Memoized per card face; callers only read or append_text the result,
+        so sharing one Text per face is safe."""
+        key = (card.type, card.color, card.value)
+        cached = self._display_text_cache.get(key)
+        if cached is not None:
+            return cached
+
         color_style = self.color_map.get(card.color, "white")
         
         # Special formatting for different card types
-        if card.type == CardType.NUMBER:
+        if card.type is CardType.NUMBER:
             display_text = f"{card.value}"
-        elif card.type == CardType.WILD:
+        elif card.type is CardType.WILD:
             display_text = "? WILD"
             color_style = "rainbow"
-        elif card.type == CardType.WILD_DRAW:
+        elif card.type is CardType.WILD_DRAW:
             display_text = "+4 WILD"
             color_style = "rainbow"
         else:
-            card_str = str(card).upper()
-            if "DRAW TWO" in card_str:
-                display_text = "+2"
-            elif "REVERSE" in card_str:
-                display_text = "<-"
-            elif "SKIP" in card_str:
-                display_text = "!"
-            else:
-                display_text = card_str
-        
-        return Text(display_text, style=f"bold {color_style}")
+            display_text = _TYPE_TO_SYMBOL.get(card.type) or str(card).upper()
+
+        text = Text(display_text, style=f"bold {color_style}")
+        self._display_text_cache[key] = text
+        return text
     
     def _create_card_panel(self, card: Card, playable: bool = True) -> Panel:
-        """Create a panel representation of a card."""
+        """Create a panel representation of a card (memoized per face)."""
+        key = (card.type, card.color, card.value, playable)
+        cached = self._card_panel_cache.get(key)
+        if cached is not None:
+            return cached
+
         card_text = self._format_card_display(card)
-        
+
         # Add playability indicator
         if playable:
             border_style = "green"
@@ -307,17 +390,19 @@ class UnoCLI:
             border_style = "red"
             suffix = " ✗"
         
-        card_content = Text()
-        card_content.append_text(card_text)
-        card_content.append(suffix, style=f"bold {border_style}")
-        
+        # Build the spans in one shot instead of append-by-append
+        card_content = Text.assemble(card_text, (suffix, f"bold {border_style}"))
+
         color_style = self.color_map.get(card.color, "white")
-        return Panel(
+        panel = Panel(
             Align.center(card_content),
             style=color_style,
             width=12,
             height=3
         )
+        self._card_panel_cache[key] = panel
+        return panel
+
     def _get_player_names(self) -> List[str]:
         """Get player names from user input with rich prompts."""
         players = []
@@ -359,472 +444,524 @@ class UnoCLI:
         return players
 
     def _play_turn(self):
-        """Play a single turn with rich formatting."""
+        """Play a single turn with rich formatting.
+
+        Input errors re-prompt inside a loop instead of recursing into
+        _play_turn - a bad keystroke used to re-render the whole game state
+        (and grow the call stack); now it only costs a new prompt."""
         current_player = self.game.get_current_player()
-        
-        # Turn header
-        turn_panel = Panel(
-            Text(f"🎯 {current_player}'s Turn", style="bold cyan", justify="center"),
-            style="cyan"
-        )
-        self.console.print(turn_panel)
-        
-        # Game state display
-        self._display_game_state()
-        
+
+        # Turn header - constant per player, so build each one once
+        turn_panel = self._turn_panel_cache.get(current_player)
+        if turn_panel is None:
+            turn_panel = self._turn_panel_cache[current_player] = Panel(
+                Text(f"🎯 {current_player}'s Turn", style="bold cyan", justify="center"),
+                style="cyan"
+            )
+
+        # The turn's output is collected into one Group and printed with a
+        # single console.print, so Rich runs its measure/render pipeline
+        # (and writes to stdout) once per frame instead of once per section
+        frame = [turn_panel, self._render_game_state()]
+
         # Handle forced draw
         if self.game.forced_draw > 0:
-            current_player = self.game.get_current_player()
             hand = self.game.get_player_hand(current_player)
-            
-            # Check if player has any +2 cards to stack
-            has_draw_two = any(card.type == CardType.DRAW_TWO for card in hand)
-            
-            if has_draw_two:
-                warning_panel = Panel(
-                    f"⚠️  You must draw {self.game.forced_draw} cards!\n💡 Or play a +2 card to stack and pass to next player",
-                    title="Forced Draw - Stack Option Available",
-                    style="yellow"
-                )
-                self.console.print(warning_panel)
-                
+
+            # One pass over the hand covers the sort, the selection map and
+            # the +2 stack check
+            view = self._summarize_hand(hand)
+
+            if view.has_draw_two:
+                # The warning text only varies with the draw count, so the
+                # panels are cached by (count, stackable)
+                key = (self.game.forced_draw, True)
+                warning_panel = self._warning_panel_cache.get(key)
+                if warning_panel is None:
+                    warning_panel = self._warning_panel_cache[key] = Panel(
+                        f"⚠️  You must draw {self.game.forced_draw} cards!\n💡 Or play a +2 card to stack and pass to next player",
+                        title="Forced Draw - Stack Option Available",
+                        style="yellow"
+                    )
+                frame.append(warning_panel)
+
                 # Show player's hand so they can see their +2 cards
-                self._display_player_hand(current_player)
-                
-                # Get player action - they can play a +2 or draw
-                action = Prompt.ask(
-                    f"\n[bold yellow]Choose action[/bold yellow]: [cyan][1-{len(hand)}][/cyan] to play card (only +2 allowed), [cyan]'d'[/cyan] to draw {self.game.forced_draw} cards"
-                ).strip().lower()
-                
-                if action == 'd':
-                    # Player chooses to draw
-                    drawn = self.game.handle_forced_draw(self.game.current_player)
-                    
-                    # Display all drawn cards as full-sized cards
-                    self.console.print(Text("Drew cards:", style="bold yellow"))
-                    
-                    # Create panels for each drawn card
-                    card_panels = [self._create_full_card_panel(card, "yellow") for card in drawn]
-                    
-                    # Display cards in columns
-                    cards_row = Columns(card_panels, width=14, expand=False)
-                    self.console.print(cards_row)
-                    
-                    # Pause to let player see the drawn cards
-                    Prompt.ask("Press Enter to continue", default="")
-                    
-                    self.game._next_turn()
-                    return
-                else:
+                frame.append(self._render_player_hand(current_player, view))
+                self.console.print(Group(*frame))
+
+                while True:
+                    # Get player action - they can play a +2 or draw
+                    action = Prompt.ask(
+                        f"\n[bold yellow]Choose action[/bold yellow]: [cyan][1-{len(hand)}][/cyan] to play card (only +2 allowed), [cyan]'d'[/cyan] to draw {self.game.forced_draw} cards"
+                    ).strip().lower()
+
+                    if action == 'd':
+                        # Player chooses to draw
+                        drawn = self.game.handle_forced_draw(self.game.current_player)
+
+                        # Display all drawn cards as full-sized cards
+                        self.console.print(Text("Drew cards:", style="bold yellow"))
+
+                        # Create panels for each drawn card
+                        card_panels = [self._create_full_card_panel(card, "yellow") for card in drawn]
+
+                        # Display cards in columns
+                        cards_row = Columns(card_panels, width=14, expand=False)
+                        self.console.print(cards_row)
+
+                        # Pause to let player see the drawn cards
+                        Prompt.ask("Press Enter to continue", default="")
+
+                        self.game._next_turn()
+                        return
+
                     # Player tries to play a card (must be +2)
                     try:
                         display_index = int(action) - 1
-                        if 0 <= display_index < len(self._current_sorted_hand):
-                            # Get the card from the sorted hand
-                            card = self._current_sorted_hand[display_index]
-                            # Find the original index in the unsorted hand
-                            original_hand = self.game.get_player_hand(current_player)
-                            card_index = original_hand.index(card)
-                            
-                            success, message = self.game.play_card(self.game.current_player, card_index)
-                            
-                            if success:
-                                if message:  # Win message
-                                    win_panel = Panel(
-                                        Text(f"🎉 {message}", style="bold gold1", justify="center"),
-                                        style="gold1"
-                                    )
-                                    self.console.print(win_panel)
-                                else:
-                                    played_text = Text("Played: ")
-                                    played_text.append_text(self._format_card_display(card))
-                                    stack_text = Text(f" (Stacked! Next player must draw {self.game.forced_draw} cards)")
-                                    played_text.append_text(stack_text)
-                                    played_panel = Panel(played_text, style="green")
-                                    self.console.print(played_panel)
-                                return
-                            else:
-                                error_panel = Panel(f"❌ {message}", style="red")
-                                self.console.print(error_panel)
-                                self._play_turn()  # Try again
-                                return
-                        else:
-                            self.console.print("[red]Invalid card number![/red]")
-                            self._play_turn()  # Try again
-                            return
                     except ValueError:
                         self.console.print("[red]Invalid input![/red]")
-                        self._play_turn()  # Try again
+                        continue
+
+                    if not 0 <= display_index < len(self._current_sorted_hand):
+                        self.console.print("[red]Invalid card number![/red]")
+                        continue
+
+                    # Get the card and its original hand index from
+                    # the maps built at display time
+                    card = self._current_sorted_hand[display_index]
+                    card_index = self._current_sorted_to_original[display_index]
+
+                    success, message = self.game.play_card(self.game.current_player, card_index)
+
+                    if success:
+                        if message:  # Win message
+                            win_panel = Panel(
+                                Text(f"🎉 {message}", style="bold gold1", justify="center"),
+                                style="gold1"
+                            )
+                            self.console.print(win_panel)
+                        else:
+                            played_text = Text.assemble(
+                                "Played: ",
+                                self._format_card_display(card),
+                                f" (Stacked! Next player must draw {self.game.forced_draw} cards)",
+                            )
+                            played_panel = Panel(played_text, style="green")
+                            self.console.print(played_panel)
                         return
+
+                    error_panel = Panel(f"❌ {message}", style="red")
+                    self.console.print(error_panel)
             else:
                 # No +2 cards, must draw
-                warning_panel = Panel(
-                    f"⚠️  You must draw {self.game.forced_draw} cards!",
-                    title="Forced Draw",
-                    style="red"
-                )
-                self.console.print(warning_panel)
-                
+                key = (self.game.forced_draw, False)
+                warning_panel = self._warning_panel_cache.get(key)
+                if warning_panel is None:
+                    warning_panel = self._warning_panel_cache[key] = Panel(
+                        f"⚠️  You must draw {self.game.forced_draw} cards!",
+                        title="Forced Draw",
+                        style="red"
+                    )
+                frame.append(warning_panel)
+                self.console.print(Group(*frame))
+
                 Prompt.ask("Press Enter to draw cards", default="")
                 drawn = self.game.handle_forced_draw(self.game.current_player)
-                
+
                 # Display all drawn cards as full-sized cards
                 self.console.print(Text("Drew cards:", style="bold yellow"))
-                
+
                 # Create panels for each drawn card
                 card_panels = [self._create_full_card_panel(card, "yellow") for card in drawn]
-                
+
                 # Display cards in columns
                 cards_row = Columns(card_panels, width=14, expand=False)
                 self.console.print(cards_row)
-                
+
                 # Pause to let player see the drawn cards
                 Prompt.ask("Press Enter to continue", default="")
-                
+
                 self.game._next_turn()
                 return
-        
+
         # Show player's hand
-        self._display_player_hand(current_player)
-        
-        # Get player action
         hand = self.game.get_player_hand(current_player)
-        action = Prompt.ask(
-            f"\n[bold green]Choose action[/bold green]: [cyan][1-{len(hand)}][/cyan] to play card, [cyan], [cyan]'d'[/cyan] to draw, [cyan]'q'[/cyan] to quit"
-        ).strip().lower()
-        
-        if action == 'q':
-            self.console.print("[yellow]Thanks for playing![/yellow]")
-            exit()
-        elif action == 'd':
-            drawn = self.game.draw_card(self.game.current_player)
-            drawn_card = drawn[0]
-            
-            # Create full-sized card display for the drawn card
-            drawn_card_panel = self._create_full_card_panel(drawn_card, "yellow")
-            drawn_card_panel.title = "Drew Card"
-            
-            self.console.print(Align.center(drawn_card_panel))
-            
-            # Pause to let player see the drawn card
-            Prompt.ask("Press Enter to continue", default="")
-            
-            self.game._next_turn()
-        else:
+        frame.append(self._render_player_hand(current_player, self._summarize_hand(hand)))
+        self.console.print(Group(*frame))
+
+        # Get player action
+        while True:
+            action = Prompt.ask(
+                f"\n[bold green]Choose action[/bold green]: [cyan][1-{len(hand)}][/cyan] to play card, [cyan], [cyan]'d'[/cyan] to draw, [cyan]'q'[/cyan] to quit"
+            ).strip().lower()
+
+            if action == 'q':
+                self.console.print("[yellow]Thanks for playing![/yellow]")
+                exit()
+            elif action == 'd':
+                drawn = self.game.draw_card(self.game.current_player)
+                drawn_card = drawn[0]
+
+                # Create full-sized card display for the drawn card - the panel is
+                # shared via the face cache, so copy it before customizing the title
+                drawn_card_panel = copy.copy(self._create_full_card_panel(drawn_card, "yellow"))
+                drawn_card_panel.title = "Drew Card"
+
+                self.console.print(Align.center(drawn_card_panel))
+
+                # Pause to let player see the drawn card
+                Prompt.ask("Press Enter to continue", default="")
+
+                self.game._next_turn()
+                return
+
             try:
                 # Single card selected
                 display_index = int(action) - 1
-                if 0 <= display_index < len(self._current_sorted_hand):
-                    # Get the card from the sorted hand
-                    card = self._current_sorted_hand[display_index]
-                    # Find the original index in the unsorted hand
-                    original_hand = self.game.get_player_hand(current_player)
-                    card_index = original_hand.index(card)
-                    
-                    # Handle wild cards
-                    chosen_color = None
-                    if card.type in (CardType.WILD, CardType.WILD_DRAW):
-                        chosen_color = self._choose_color()
-                    
-                    success, message = self.game.play_card(self.game.current_player, card_index, chosen_color)
-                    
-                    if success:
-                        if message:  # Win message
-                            win_panel = Panel(
-                                Text(f"🎉 {message}", style="bold gold1", justify="center"),
-                                style="gold1"
-                            )
-                            self.console.print(win_panel)
-                        else:
-                            played_text = Text("Played: ")
-                            played_text.append_text(self._format_card_display(card))
-                            played_panel = Panel(played_text, style="green")
-                            self.console.print(played_panel)
-                    else:
-                        error_panel = Panel(f"❌ {message}", style="red")
-                        self.console.print(error_panel)
-                        self._play_turn()  # Try again
-                else:
-                    self.console.print("[red]Invalid card number![/red]")
-                    self._play_turn()  # Try again
             except ValueError:
                 self.console.print("[red]Invalid input! Use numbers like '1' or '1,2,3'[/red]")
-                self._play_turn()  # Try again
+                continue
+
+            if not 0 <= display_index < len(self._current_sorted_hand):
+                self.console.print("[red]Invalid card number![/red]")
+                continue
 
-    def _display_game_state(self):
-        """Display the current game state with top card, draw pile, and other players."""
+            # Get the card and its original hand index from the maps
+            # built at display time
+            card = self._current_sorted_hand[display_index]
+            card_index = self._current_sorted_to_original[display_index]
+
+            # Handle wild cards
+            chosen_color = None
+            if card.type is CardType.WILD or card.type is CardType.WILD_DRAW:
+                chosen_color = self._choose_color()
+
+            success, message = self.game.play_card(self.game.current_player, card_index, chosen_color)
+
+            if success:
+                if message:  # Win message
+                    win_panel = Panel(
+                        Text(f"🎉 {message}", style="bold gold1", justify="center"),
+                        style="gold1"
+                    )
+                    self.console.print(win_panel)
+                else:
+                    played_text = Text.assemble("Played: ", self._format_card_display(card))
+                    played_panel = Panel(played_text, style="green")
+                    self.console.print(played_panel)
+                return
+
+            error_panel = Panel(f"❌ {message}", style="red")
+            self.console.print(error_panel)
+
+    def _render_game_state(self) -> Columns:
+        """Build the game-state row: top card, draw pile, and other players.
+
+        Each sub-panel is cached alongside the inputs it was rendered from
+        and only rebuilt when those inputs change - between consecutive
+        turns the top card usually stays put and the draw pile only moves
+        on draws, so most turns reuse all three panels."""
         current_player = self.game.get_current_player()
-        
-        # Create top card display with colored background
         top_card = self.game.get_top_card()
-        
-        # Format top card content with ASCII art for numbers
-        top_card_text = Text()
-        
-        if top_card.type == CardType.NUMBER:
-            # Use ASCII art for number cards
-            ascii_number = self._create_ascii_number(top_card.value)
-            top_card_text = ascii_number
-        elif top_card.type == CardType.WILD:
-            # Use ASCII art for WILD symbol
-            ascii_symbol = self._create_ascii_symbol("?")
-            top_card_text = ascii_symbol
-        elif top_card.type == CardType.WILD_DRAW:
-            # Use ASCII art for +4 symbol
-            ascii_symbol = self._create_ascii_symbol("+4")
-            top_card_text = ascii_symbol
+
+        # Top card panel - keyed by the card object and the active color
+        # (the color matters for wilds, where it reflects the chosen color)
+        top_key = (id(top_card), self.game.current_color)
+        cached = self._gs_cache.get("top")
+        if cached is not None and cached[0] == top_key:
+            top_card_panel = cached[1]
         else:
-            # Use ASCII art for other card types
-            card_value = str(top_card).upper()
-            if "DRAW TWO" in card_value:
-                ascii_symbol = self._create_ascii_symbol("+2")
-                top_card_text = ascii_symbol
-            elif "REVERSE" in card_value:
-                ascii_symbol = self._create_ascii_symbol("<-")
-                top_card_text = ascii_symbol
-            elif "SKIP" in card_value:
-                ascii_symbol = self._create_ascii_symbol("!")
-                top_card_text = ascii_symbol
+            # Format top card content with ASCII art, dispatching on the type
+            top_card_text = Text()
+            if top_card.type is CardType.NUMBER:
+                top_card_text = self._create_ascii_number(top_card.value)
             else:
-                top_card_text.append(f"\n{card_value}\n", style="bold white")
-        
-        # Always add color name - for wild cards, show the current chosen color
-        if top_card.type in (CardType.WILD, CardType.WILD_DRAW):
-            # For wild cards, show the chosen color
-            color_name = self.game.current_color.value.lower()
-            top_card_text.append(f"\n{color_name}", style="bold white")
-            background_color = self.color_map.get(self.game.current_color, "magenta")
-        elif top_card.color != Color.WILD:
-            color_name = top_card.color.value.lower()
-            top_card_text.append(f"\n{color_name}", style="bold white")
-            background_color = self.color_map.get(top_card.color, "white")
+                symbol = _TYPE_TO_SYMBOL.get(top_card.type)
+                if symbol is not None:
+                    top_card_text = self._create_ascii_symbol(symbol)
+                else:
+                    top_card_text.append(f"\n{str(top_card).upper()}\n", style="bold white")
+
+            # Always add color name - for wild cards, show the current chosen color
+            if top_card.type is CardType.WILD or top_card.type is CardType.WILD_DRAW:
+                top_card_text.append(f"\n{self._color_name[self.game.current_color]}", style="bold white")
+                background_color = self._bg_for[self.game.current_color]
+            elif top_card.color is not Color.WILD:
+                top_card_text.append(f"\n{self._color_name[top_card.color]}", style="bold white")
+                background_color = self._bg_for[top_card.color]
+            else:
+                background_color = "magenta"
+
+            top_card_panel = Panel(
+                Align.center(top_card_text),
+                title="🎯 Top Card",
+                style=f"green on {background_color}",
+                width=20,
+                height=8  # Increased height to accommodate ASCII art
+            )
+            self._gs_cache["top"] = (top_key, top_card_panel)
+
+        # Draw pile panel - only the card count varies
+        draw_key = len(self.game.draw_pile)
+        cached = self._gs_cache.get("draw")
+        if cached is not None and cached[0] == draw_key:
+            draw_pile_panel = cached[1]
         else:
-            background_color = "magenta"
-        
-        top_card_panel = Panel(
-            Align.center(top_card_text),
-            title="🎯 Top Card",
-            style=f"green on {background_color}",
-            width=20,
-            height=8  # Increased height to accommodate ASCII art
-        )
-        
-        # Create draw pile display
-        draw_pile_content = Text()
-        draw_pile_content.append(f"{len(self.game.draw_pile)} cards", style="bold blue")
-        
-        draw_pile_panel = Panel(
-            Align.center(draw_pile_content),
-            title="🂠 Draw Pile",
-            style="blue",
-            width=20,
-            height=8  # Match top card height
-        )
-                
-        # Create other players display
-        player_counts = self.game.get_player_counts()
-        other_players = [(name, count) for name, count in player_counts.items() if name != current_player]
-        
-        if other_players:
-            # Create horizontal layout: Player1: X cards | Player2: Y cards
-            players_text = Text()
-            for i, (name, count) in enumerate(other_players):
-                if i > 0:
-                    players_text.append(" | ", style="dim")
-                players_text.append(f"{name}: ", style="cyan")
-                players_text.append(f"{count} cards", style="yellow1")
-            
-            other_players_panel = Panel(
-                Align.center(players_text),
-                title="👥 Other Players",
-                style="dim",
-                width=40,
+            draw_pile_content = Text()
+            draw_pile_content.append(f"{draw_key} cards", style="bold blue")
+
+            draw_pile_panel = Panel(
+                Align.center(draw_pile_content),
+                title="🂠 Draw Pile",
+                style="blue",
+                width=20,
                 height=8  # Match top card height
             )
+            self._gs_cache["draw"] = (draw_key, draw_pile_panel)
+
+        # Other players panel - varies with whose turn it is and the counts
+        player_counts = self.game.get_player_counts()
+        others_key = (current_player, tuple(player_counts.values()))
+        cached = self._gs_cache.get("others")
+        if cached is not None and cached[0] == others_key:
+            other_players_panel = cached[1]
         else:
+            # Horizontal layout: Player1: X cards | Player2: Y cards. The
+            # name prefixes are fixed for the whole game, so they are built
+            # once and only the count spans are fresh per rebuild
+            parts = []
+            for name, count in player_counts.items():
+                if name == current_player:
+                    continue
+                prefix = self._player_prefixes.get(name)
+                if prefix is None:
+                    prefix = self._player_prefixes[name] = Text(f"{name}: ", style="cyan")
+                if parts:
+                    parts.append((" | ", "dim"))
+                parts.append(prefix)
+                parts.append((f"{count} cards", "yellow1"))
+            players_text = Text.assemble(*parts) if parts else Text("No other players", style="dim")
+
             other_players_panel = Panel(
-                Align.center(Text("No other players", style="dim")),
+                Align.center(players_text),
                 title="👥 Other Players",
                 style="dim",
                 width=40,
                 height=8  # Match top card height
             )
+            self._gs_cache["others"] = (others_key, other_players_panel)
+
+        # Arrange in columns: Top Card, Draw Pile, Other Players. When all
+        # three sub-panels were cache hits the Columns wrapper is reused
+        # too, so a steady-state turn prints without any layout rebuild.
+        # The identity tuple is safe because the panels are pinned by
+        # _gs_cache for as long as they can appear here
+        panels_key = (id(top_card_panel), id(draw_pile_panel), id(other_players_panel))
+        if self._gs_columns is not None and self._gs_columns[0] == panels_key:
+            game_state = self._gs_columns[1]
+        else:
+            game_state = Columns([top_card_panel, draw_pile_panel, other_players_panel], expand=False)
+            self._gs_columns = (panels_key, game_state)
+        return game_state
         
-        # Arrange in columns: Top Card, Draw Pile, Direction, Other Players
-        game_state = Columns([top_card_panel, draw_pile_panel, other_players_panel], expand=False)
-        self.console.print(game_state)
-        
-    def _display_player_hand(self, current_player: str):
-        """Display the current player's hand horizontally with framed cards."""
-        hand = self.game.get_player_hand(current_player)
-        
-        # Sort the hand by color and number
-        sorted_hand = sorted(hand, key=lambda card: card.get_sort_key())
-        
-        # Store the sorted hand for later use in card selection
+    def _summarize_hand(self, hand: List[Card]) -> _HandView:
+        """Summarize a hand for one turn in a single pass.
+
+        The hand is sorted by color and number with each card's original
+        index kept alongside, so selection is an O(1) lookup instead of an
+        index() scan (which also picks the wrong slot for duplicate cards).
+        The hand is mirrored into flat parallel arrays first - the packed
+        sort keys as an int list and the type ordinals as bytes - so the
+        sort compares plain ints and the +2 stack check is a C-level bytes
+        membership test instead of a per-card attribute-compare loop.
+
+        The finished view is kept until the hand changes (checked via an
+        identity fingerprint, since Cards are never mutated), so redraws
+        of an untouched hand skip the sort entirely."""
+        fingerprint = tuple(id(card) for card in hand)
+        cached = self._last_hand_summary
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        keys = [card.sort_key for card in hand]
+        types = bytes((key // 1024) % 1024 for key in keys)
+        order = sorted(range(len(hand)), key=keys.__getitem__)
+        view = _HandView(
+            [hand[i] for i in order],
+            order,
+            _DRAW_TWO_ORD in types,
+            [keys[i] for i in order],
+        )
+        self._last_hand_summary = (fingerprint, view)
+        return view
+
+    def _create_hand_card_panel(self, card: Card, playable: bool) -> Panel:
+        """Create the framed hand-card panel for a face and playable state.
+
+        Memoized like the other card panels; a deck shows at most ~54 faces
+        in two border states, so the cache stays naturally bounded."""
+        key = (card.type, card.color, card.value, playable)
+        cached = self._hand_panel_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Card content without the number label (that goes above the card)
+        if card.type is CardType.NUMBER:
+            card_content = self._create_ascii_number(card.value)
+        else:
+            symbol = _TYPE_TO_SYMBOL.get(card.type)
+            if symbol is not None:
+                card_content = self._create_ascii_symbol(symbol)
+            else:
+                card_content = Text()
+                card_content.append(f"\n{str(card).upper()}\n", style="bold white")
+        if card.color is not Color.WILD:
+            card_content.append(f"\n{self._color_name[card.color]}", style="bold white")
+
+        panel = Panel(
+            Align.center(card_content),
+            style=self._panel_style[(playable, card.color)],
+            width=14,
+            height=8  # Increased height to accommodate ASCII art
+        )
+        self._hand_panel_cache[key] = panel
+        return panel
+
+    def _render_player_hand(self, current_player: str, view: Optional[_HandView] = None) -> Group:
+        """Build the current player's hand as one renderable group of framed cards."""
+        if view is None:
+            view = self._summarize_hand(self.game.get_player_hand(current_player))
+        sorted_hand = view.sorted_cards
+
+        # Store the sorted hand and index map for later use in card selection
         self._current_sorted_hand = sorted_hand
-        
+        self._current_sorted_to_original = view.sorted_to_original
+
         hand_title = f"🃏 {current_player}'s Hand ({len(sorted_hand)} cards)"
-        hand_panel = Panel(hand_title, style="black")
-        self.console.print(hand_panel)
-        
-        # Create framed card displays
-        card_panels = []
-        for i, card in enumerate(sorted_hand):
-            # Use display index (i+1) instead of original index
-            playable = self._is_card_playable(card)
-            
-            # Create card content without number (number will be above)
-            card_content = Text()
-            
-            # Format card value/type with ASCII art for numbers
-            if card.type == CardType.NUMBER:
-                # Use ASCII art for number cards
-                ascii_number = self._create_ascii_number(card.value)
-                card_content = ascii_number
-                if card.color != Color.WILD:
-                    color_name = card.color.value.lower()
-                    card_content.append(f"\n{color_name}", style="bold white")
-            elif card.type == CardType.WILD:
-                # Use ASCII art for WILD symbol
-                ascii_symbol = self._create_ascii_symbol("?")
-                card_content = ascii_symbol
-            elif card.type == CardType.WILD_DRAW:
-                # Use ASCII art for +4 symbol
-                ascii_symbol = self._create_ascii_symbol("+4")
-                card_content = ascii_symbol
-            else:
-                # Use ASCII art for other card types
-                card_value = str(card).upper()
-                if card.color != Color.WILD:
-                    color_name = card.color.value.lower()
-                    if "DRAW TWO" in card_value:
-                        ascii_symbol = self._create_ascii_symbol("+2")
-                        card_content = ascii_symbol
-                        card_content.append(f"\n{color_name}", style="bold white")
-                    elif "REVERSE" in card_value:
-                        ascii_symbol = self._create_ascii_symbol("<-")
-                        card_content = ascii_symbol
-                        card_content.append(f"\n{color_name}", style="bold white")
-                    elif "SKIP" in card_value:
-                        ascii_symbol = self._create_ascii_symbol("!")
-                        card_content = ascii_symbol
-                        card_content.append(f"\n{color_name}", style="bold white")
-                    else:
-                        card_content.append(f"\n{card_value}\n\n{color_name}", style="bold white")
-                else:
-                    if "DRAW TWO" in card_value:
-                        ascii_symbol = self._create_ascii_symbol("+2")
-                        card_content = ascii_symbol
-                    elif "REVERSE" in card_value:
-                        ascii_symbol = self._create_ascii_symbol("<-")
-                        card_content = ascii_symbol
-                    elif "SKIP" in card_value:
-                        ascii_symbol = self._create_ascii_symbol("!")
-                        card_content = ascii_symbol
-                    else:
-                        card_content.append(f"\n{card_value}\n", style="bold white")
-            
-            # Determine background color and border style
-            if card.color != Color.WILD:
-                background_color = self.color_map.get(card.color, "white")
-            else:
-                background_color = "magenta"
-            
-            border_style = "green" if playable else "red"
-            
-            # Create card number label above the card (using display index for playing)
-            display_index = i + 1
-            card_number = Text(f"[{display_index}]", style="bold white", justify="center")
-            
-            # Create a small panel for each card with colored background
-            card_panel = Panel(
-                Align.center(card_content),
-                style=f"{border_style} on {background_color}",
-                width=14,
-                height=8  # Increased height to accommodate ASCII art
-            )
-            
-            # Combine number and card panel
-            card_with_number = Align.center(
-                Text.from_markup(f"[bold white]\\[{display_index}][/bold white]\n") + 
-                Text(" ") # This will be replaced by the panel in columns
-            )
-            
-            card_panels.append((f"[{display_index}]", card_panel))
-        
-        # Display cards in rows, maximum 10 cards per row for better spacing
+        renderables = [Panel(hand_title, style="black")]
+
+        # SoA mirror of the sorted hand: color/type/value ordinals unpacked
+        # from the packed sort keys into flat int lists, so the playability
+        # loop below indexes plain ints instead of chasing Card attributes
+        self._hand_colors = hand_colors = []
+        self._hand_types = hand_types = []
+        self._hand_values = hand_values = []
+        for key in view.sorted_keys:
+            color_ord, rest = divmod(key, 1048576)
+            type_ord, value_ord = divmod(rest, 1024)
+            hand_colors.append(color_ord)
+            hand_types.append(type_ord)
+            hand_values.append(value_ord)
+
+        # Playability inputs are invariant for the whole render - snapshot
+        # them once (as ordinals) instead of re-reading game state through
+        # _is_card_playable for every card
+        top_card = self.game.get_top_card()
+        cur_color_ord = _COLOR_ORDER.get(self.game.current_color, -1)
+        top_type_ord = _TYPE_ORDER[top_card.type]
+        top_value = top_card.value
+
+        # Create framed card displays, partitioned into display rows of 10
+        # as they are built - the emit stage below walks the paired rows
+        # directly instead of re-slicing a flat list. The panels themselves
+        # come from the per-face cache, so an unchanged hand redraw
+        # allocates next to nothing
         cards_per_row = 10
-        for i in range(0, len(card_panels), cards_per_row):
-            row_data = card_panels[i:i+cards_per_row]
-            
-            # Create number labels row
-            number_labels = []
-            panels_only = []
-            
-            for number_label, panel in row_data:
-                number_labels.append(Text(number_label, style="bold white", justify="center"))
-                panels_only.append(panel)
-            
-            # Display number labels
-            numbers_row = Columns(number_labels, width=14, expand=False)
-            self.console.print(numbers_row)
-            
-            # Display the card panels
-            cards_row = Columns(panels_only, width=14, expand=False)
-            self.console.print(cards_row)
-            
-            # Add spacing between rows if there are more cards
-            if i + cards_per_row < len(card_panels):
-                self.console.print()
+        rows_numbers = []  # One list of index labels per display row
+        rows_panels = []  # One list of card panels per display row
+        index_labels = self._index_labels
+        while len(index_labels) <= len(sorted_hand):
+            index_labels.append(Text(f"[{len(index_labels)}]", style="bold white", justify="center"))
+        # Evaluate playability for the whole hand in one batch expression
+        # over the ordinal arrays, so the panel loop below just indexes a
+        # precomputed flag list
+        top_is_number = top_type_ord == _NUMBER_ORD
+        playable_flags = [
+            type_ord >= _WILD_ORD or
+            color_ord == cur_color_ord or
+            type_ord == top_type_ord or
+            (top_is_number and type_ord == _NUMBER_ORD and value_ord == top_value)
+            for color_ord, type_ord, value_ord in zip(hand_colors, hand_types, hand_values)
+        ]
+
+        for i, card in enumerate(sorted_hand):
+            card_panel = self._create_hand_card_panel(card, playable_flags[i])
+
+            if i % cards_per_row == 0:
+                rows_numbers.append([])
+                rows_panels.append([])
+            rows_numbers[-1].append(index_labels[i + 1])
+            rows_panels[-1].append(card_panel)
+
+        for row, (number_labels, panels_only) in enumerate(zip(rows_numbers, rows_panels)):
+            # Blank spacing line between rows. Each row pair goes into a
+            # fixed-width grid - unlike Columns, Table.grid skips the
+            # measure-and-pack pass since every cell is exactly card width
+            if row:
+                renderables.append(_ROW_SPACER)
+            grid = Table.grid()
+            for _ in number_labels:
+                grid.add_column(width=14)
+            grid.add_row(*number_labels)
+            grid.add_row(*panels_only)
+            renderables.append(grid)
+
+        return Group(*renderables)
     
     def _display_other_players(self, current_player: str):
-        """Display other players' card counts."""
+        """Display other players' card counts.
+
+        The table is cached against (current player, counts) - redisplays
+        between game events print the prior table without rebuilding it."""
         player_counts = self.game.get_player_counts()
+        key = (current_player, tuple(player_counts.values()))
+        cached = self._other_players_table
+        if cached is not None and cached[0] == key:
+            self.console.print(cached[1])
+            return
+
         other_players = [(name, count) for name, count in player_counts.items() if name != current_player]
-        
+
         if other_players:
             # Create table for other players
             table = Table(title="👥 Other Players", style="dim")
             table.add_column("Player", style="cyan")
             table.add_column("Cards", justify="center", style="yellow")
-            
+
             for name, count in other_players:
                 table.add_row(name, str(count))
-            
+
+            self._other_players_table = (key, table)
             self.console.print(table)
     
     def _is_card_playable(self, card: Card) -> bool:
         """Check if a card is playable (for display purposes)."""
         top_card = self.game.get_top_card()
         
-        if card.type in (CardType.WILD, CardType.WILD_DRAW):
+        if card.type is CardType.WILD or card.type is CardType.WILD_DRAW:
             return True
         
-        return (card.color == self.game.current_color or
-                card.type == top_card.type or
-                (card.type == CardType.NUMBER and top_card.type == CardType.NUMBER and card.value == top_card.value))
+        return (card.color is self.game.current_color or
+                card.type is top_card.type or
+                (card.type is CardType.NUMBER and top_card.type is CardType.NUMBER and card.value == top_card.value))
 
     def _choose_color(self) -> Color:
-        """Let player choose a color for wild cards with rich interface."""
-        colors = [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]
-        
-        # Create color choice table
-        table = Table(title="🌈 Choose a Color", style="bold")
-        table.add_column("Number", justify="center", style="dim")
-        table.add_column("Color", justify="center")
-        
-        for i, color in enumerate(colors):
-            color_style = self.color_map[color]
-            color_text = Text(color.value.capitalize(), style=f"bold {color_style}")
-            table.add_row(str(i+1), color_text)
-        
-        self.console.print(table)
-        
+        """Let player choose a color for wild cards with rich interface.
+
+        The menu never changes, so its rendered ANSI is captured on the
+        first display and later wild plays write those bytes straight to
+        the terminal instead of re-running a Rich render pass."""
+        if self._color_choice_ansi is None:
+            with self.console.capture() as capture:
+                self.console.print(self._color_choice_table)
+            self._color_choice_ansi = capture.get()
+        self.console.file.write(self._color_choice_ansi)
+        self.console.file.flush()
+
         while True:
             try:
                 choice = IntPrompt.ask("[bold green]Enter color number[/bold green]", choices=["1", "2", "3", "4"])
-                return colors[choice - 1]
+                return _COLOR_CHOICES[choice - 1]
             except (ValueError, IndexError):
                 self.console.print("[red]Invalid choice! Please enter 1-4.[/red]")
 
@@ -29,13 +29,42 @@ class CardType(Enum):
     WILD_DRAW = "WILD_DRAW"
 
 
+# Fixed display ordering used for hand sorting, shared by every Card
+# Color order: RED, BLUE, GREEN, YELLOW, WILD
+_COLOR_ORDER = {
+    Color.RED: 0,
+    Color.BLUE: 1,
+    Color.GREEN: 2,
+    Color.YELLOW: 3,
+    Color.WILD: 4
+}
+
+# Type order: NUMBER, SKIP, REVERSE, DRAW_TWO, WILD, WILD_DRAW
+_TYPE_ORDER = {
+    CardType.NUMBER: 0,
+    CardType.SKIP: 1,
+    CardType.REVERSE: 2,
+    CardType.DRAW_TWO: 3,
+    CardType.WILD: 4,
+    CardType.WILD_DRAW: 5
+}
+
+
 class Card:
     """Represents a single Uno card."""
-    
+
     def __init__(self, color: Color, card_type: CardType, value: Optional[int] = None):
         self.color = color
         self.type = card_type
         self.value = value
+        # Cards are immutable once built, so the sort keys are fixed at
+        # construction. sort_key packs (color, type, value) into a single
+        # int so hand sorts compare scalars instead of building tuples
+        color_rank = _COLOR_ORDER.get(color, 999)
+        type_rank = _TYPE_ORDER.get(card_type, 999)
+        value_rank = value if value is not None else 999
+        self._sort_tuple = (color_rank, type_rank, value_rank)
+        self.sort_key = (color_rank * 1024 + type_rank) * 1024 + value_rank
 
     def __str__(self):
         if self.type == CardType.NUMBER:
@@ -54,31 +83,11 @@ class Card:
         return self.color.value
     
     def get_sort_key(self) -> tuple:
-        """Get sorting key for cards: (color_order, type_order, value)."""
-        # Color order: RED, BLUE, GREEN, YELLOW, WILD
-        color_order = {
-            Color.RED: 0,
-            Color.BLUE: 1, 
-            Color.GREEN: 2,
-            Color.YELLOW: 3,
-            Color.WILD: 4
-        }
-        
-        # Type order: NUMBER, SKIP, REVERSE, DRAW_TWO, WILD, WILD_DRAW
-        type_order = {
-            CardType.NUMBER: 0,
-            CardType.SKIP: 1,
-            CardType.REVERSE: 2, 
-            CardType.DRAW_TWO: 3,
-            CardType.WILD: 4,
-            CardType.WILD_DRAW: 5
-        }
-        
-        return (
-            color_order.get(self.color, 999),
-            type_order.get(self.type, 999),
-            self.value if self.value is not None else 999
-        )
+        """Get sorting key for cards: (color_order, type_order, value).
+
+        Precomputed in __init__; sorts that only need an ordering can use
+        the packed ``sort_key`` int instead for scalar comparisons."""
+        return self._sort_tuple
 
     def to_dict(self):
         """Convert card to dictionary representation."""
@@ -96,6 +105,12 @@ class UnoGame:
     
     def __init__(self, player_names: List[str]):
         self.players = {name: {"hand": [], "score": 0} for name in player_names}
+        # Turn order and the name->index mapping are fixed for the game's
+        # lifetime - callers look players up here instead of rebuilding
+        # list(players.keys()) on every action
+        self._player_order = list(self.players.keys())
+        self._player_indices = {name: i for i, name in enumerate(self._player_order)}
+        self._counts = dict.fromkeys(self._player_order, 0)  # Reused by get_player_counts
         self.current_player = 0
         self.direction = 1
         self.discard_pile: List[Card] = []
@@ -158,7 +173,7 @@ class UnoGame:
                 self._reshuffle_discard_pile()
             if self.draw_pile:
                 card = self.draw_pile.pop(0)
-                player_name = list(self.players.keys())[player_index]
+                player_name = self._player_order[player_index]
                 self.players[player_name]["hand"].append(card)
                 drawn_cards.append(card)
         return drawn_cards
@@ -186,7 +201,7 @@ class UnoGame:
 
     def play_multiple_cards(self, player_index: int, card_indices: List[int], chosen_color: Optional[Color] = None) -> Tuple[bool, Optional[str]]:
         """Attempt to play multiple cards from a player's hand (same number and color only)."""
-        player_name = list(self.players.keys())[player_index]
+        player_name = self._player_order[player_index]
         hand = self.players[player_name]["hand"]
         
         # Get the cards to be played
@@ -293,7 +308,11 @@ class UnoGame:
 
     def get_current_player(self) -> str:
         """Get the name of the current player."""
-        return list(self.players.keys())[self.current_player]
+        return self._player_order[self.current_player]
+
+    def player_index(self, player_name: str) -> int:
+        """Get a player's fixed index in turn order (-1 if unknown)."""
+        return self._player_indices.get(player_name, -1)
 
     def get_player_hand(self, player_name: str) -> List[Card]:
         """Get a player's hand."""
@@ -304,8 +323,14 @@ class UnoGame:
         return self.discard_pile[-1]
 
     def get_player_counts(self) -> Dict[str, int]:
-        """Get the number of cards each player has."""
-        return {name: len(self.players[name]["hand"]) for name in self.players}
+        """Get the number of cards each player has.
+
+        The returned dict is owned by the game and refreshed in place, so the
+        render loop does not allocate a new mapping on every call - treat it
+        as a read-only snapshot."""
+        for name in self._player_order:
+            self._counts[name] = len(self.players[name]["hand"])
+        return self._counts
 
     def is_game_over(self) -> bool:
         """Check if the game is over."""
@@ -14,13 +14,86 @@ except ImportError:
     app = None
 
 from .game import UnoGame, Card, Color, CardType
+from pathlib import Path
+from types import MappingProxyType
 from typing import List, Optional
 import asyncio
 
 
+# Directory holding the card animation stylesheet
+_ASSETS_DIR = Path(__file__).parent / "assets"
+
+# Color mappings for beautiful card styling - pure constants, so they live at
+# module scope shared across instances, and read-only so strings derived from
+# them can be memoized safely
+_COLOR_STYLES = MappingProxyType({
+    Color.RED: MappingProxyType({"bg": "bg-red-500", "text": "text-white", "border": "border-red-600", "hover": "hover:bg-red-600"}),
+    Color.BLUE: MappingProxyType({"bg": "bg-blue-500", "text": "text-white", "border": "border-blue-600", "hover": "hover:bg-blue-600"}),
+    Color.GREEN: MappingProxyType({"bg": "bg-green-500", "text": "text-white", "border": "border-green-600", "hover": "hover:bg-green-600"}),
+    Color.YELLOW: MappingProxyType({"bg": "bg-yellow-400", "text": "text-black", "border": "border-yellow-500", "hover": "hover:bg-yellow-500"}),
+    Color.WILD: MappingProxyType({"bg": "bg-gradient-to-br from-purple-500 to-pink-500", "text": "text-white", "border": "border-purple-600", "hover": "hover:from-purple-600 hover:to-pink-600"}),
+})
+
+# Hand card class strings per (color, playability), assembled once at import
+_PLAYABLE_CARD_CLASS = MappingProxyType({
+    c: (
+        "uno-card w-full h-24 wild-card-gradient text-white rounded-xl shadow-lg "
+        "flex items-center justify-between p-4 mb-2 border-2 border-green-400"
+        if c == Color.WILD else
+        f"uno-card w-full h-24 {style['bg']} {style['text']} rounded-xl shadow-lg "
+        f"flex items-center justify-between p-4 mb-2 border-2 border-green-400 {style['hover']}"
+    )
+    for c, style in _COLOR_STYLES.items()
+})
+_DISABLED_CARD_CLASS = "uno-card-disabled w-full h-24 bg-gray-300 text-gray-500 rounded-xl shadow-lg flex items-center justify-between p-4 mb-2 border-2 border-gray-400"
+
+
+# Title-cased color names, built once - .title() allocates a fresh string on
+# every call and card renderers need these per card per refresh
+_COLOR_TITLE = {c: c.value.title() for c in Color}
+
+# Card display strings keyed by (color, type, value) - the card domain is
+# finite (~54 distinct faces), so str(card) runs at most once per face
+_CARD_STR = {}
+
+
+def _card_str(card: Card) -> str:
+    """Memoized str(card); cards are immutable once dealt."""
+    key = (card.color, card.type, card.value)
+    text = _CARD_STR.get(key)
+    if text is None:
+        text = _CARD_STR[key] = str(card)
+    return text
+
+
+# Pre-bound template for the static face of a hand card - one ui.html child
+# per card instead of a nested column with three labels, which keeps the
+# per-card construction path to a single element
+_HAND_CARD_FACE = (
+    '<div class="flex flex-col gap-1">'
+    '<div class="text-xs font-bold opacity-70">#{n}</div>'
+    '<div class="text-xl font-bold">{text}</div>'
+    '{color}'
+    '</div>'
+).format
+
+
+# Toggles body.paused while the tab is hidden, freezing the infinite
+# gradient/pulse animations for backgrounded sessions
+_VISIBILITY_SCRIPT = """
+        <script>
+            document.addEventListener('visibilitychange', () => {
+                document.body.classList.toggle('paused', document.hidden);
+            });
+        </script>
+        """
+
+
 class UnoUI:
     """Modern web-based user interface for Uno game with enhanced visuals."""
-    
+
+    _css_injected = False  # Guard against per-instance duplicate injection
+
     def __init__(self):
         if ui is None:
             raise ImportError("NiceGUI is required for the UI. Install with: pip install nicegui")
@@ -33,104 +106,37 @@ class UnoUI:
         self.hand_container = None
         self.players_container = None
         self.top_card_container = None
+        self.turn_label = None
+        self.direction_label = None
+        self.forced_draw_label = None
+        self.draw_count_label = None
+        self._pending_refresh = False  # A coalescing refresh timer is armed
+        self._sorted_hand_cache = {}  # {player: (hand fingerprint, sorted view)}
+        self._opponent_widgets = {}  # {player: (card, count label, uno label, warn label)}
+        self._last_counts = {}  # Card counts behind the sidebar labels
+        self._color_dialog = None  # Pooled wild-card color picker
+        self._pending_wild_index = None  # Hand index of the wild being played
         
-        # Color mappings for beautiful card styling
-        self.color_styles = {
-            Color.RED: {"bg": "bg-red-500", "text": "text-white", "border": "border-red-600", "hover": "hover:bg-red-600"},
-            Color.BLUE: {"bg": "bg-blue-500", "text": "text-white", "border": "border-blue-600", "hover": "hover:bg-blue-600"},
-            Color.GREEN: {"bg": "bg-green-500", "text": "text-white", "border": "border-green-600", "hover": "hover:bg-green-600"},
-            Color.YELLOW: {"bg": "bg-yellow-400", "text": "text-black", "border": "border-yellow-500", "hover": "hover:bg-yellow-500"},
-            Color.WILD: {"bg": "bg-gradient-to-br from-purple-500 to-pink-500", "text": "text-white", "border": "border-purple-600", "hover": "hover:from-purple-600 hover:to-pink-600"}
-        }
-        
+        # Shared module-level style constants (kept as an attribute for
+        # existing call sites)
+        self.color_styles = _COLOR_STYLES
+
         self._setup_custom_css()
 
     def _setup_custom_css(self):
-        """Add custom CSS for enhanced card animations and styling."""
-        ui.add_head_html("""
-        <style>
-            .uno-card {
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                cursor: pointer;
-                border-radius: 12px;
-                box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            }
-            
-            .uno-card:hover {
-                transform: translateY(-8px) scale(1.05);
-                box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-                z-index: 10;
-            }
-            
-            .uno-card-disabled {
-                opacity: 0.5;
-                cursor: not-allowed;
-            }
-            
-            .uno-card-disabled:hover {
-                transform: none;
-                box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            }
-            
-            .card-play-animation {
-                animation: cardPlay 0.6s ease-out forwards;
-            }
-            
-            @keyframes cardPlay {
-                0% { transform: scale(1) rotate(0deg); opacity: 1; }
-                50% { transform: scale(1.2) rotate(5deg); opacity: 0.8; }
-                100% { transform: scale(0.8) rotate(0deg); opacity: 0; }
-            }
-            
-            .draw-pile-shake {
-                animation: shake 0.5s ease-in-out;
-            }
-            
-            @keyframes shake {
-                0%, 100% { transform: translateX(0); }
-                25% { transform: translateX(-5px); }
-                75% { transform: translateX(5px); }
-            }
-            
-            .player-turn-indicator {
-                animation: pulse 2s infinite;
-                border-radius: 12px;
-            }
-            
-            @keyframes pulse {
-                0%, 100% { box-shadow: 0 0 0 0 rgba(59, 130, 246, 0.7); }
-                50% { box-shadow: 0 0 0 10px rgba(59, 130, 246, 0); }
-            }
-            
-            .wild-card-gradient {
-                background: linear-gradient(45deg, #ef4444, #3b82f6, #10b981, #f59e0b);
-                background-size: 400% 400%;
-                animation: gradientShift 3s ease infinite;
-            }
-            
-            @keyframes gradientShift {
-                0% { background-position: 0% 50%; }
-                50% { background-position: 100% 50%; }
-                100% { background-position: 0% 50%; }
-            }
-            
-            .notification-success {
-                background: linear-gradient(135deg, #10b981, #059669);
-                color: white;
-                border-radius: 8px;
-                padding: 12px 16px;
-                box-shadow: 0 10px 15px -3px rgba(16, 185, 129, 0.3);
-            }
-            
-            .notification-error {
-                background: linear-gradient(135deg, #ef4444, #dc2626);
-                color: white;
-                border-radius: 8px;
-                padding: 12px 16px;
-                box-shadow: 0 10px 15px -3px rgba(239, 68, 68, 0.3);
-            }
-        </style>
-        """)
+        """Serve the card animation styles as a cacheable external stylesheet.
+
+        Linking /uno-assets/uno.css instead of inlining a <style> block keeps
+        the initial HTML payload small, and the year-long cache age lets the
+        browser skip the download entirely on repeat visits and extra tabs.
+        The guard keeps multiple UnoUI instances from mounting the static
+        route or appending the <link> tag more than once."""
+        if UnoUI._css_injected:
+            return
+        app.add_static_files('/uno-assets', str(_ASSETS_DIR), max_cache_age=31536000)
+        ui.add_head_html('<link rel="stylesheet" href="/uno-assets/uno.css">')
+        ui.add_body_html(_VISIBILITY_SCRIPT)
+        UnoUI._css_injected = True
 
     def show_landing_page(self):
         """Display an enhanced landing page for setting up a game."""
@@ -178,6 +184,7 @@ class UnoUI:
 
                     ui.notify(f"Starting game with {len(self.player_names)} players!", type='positive', position='top')
                     self.game = UnoGame(self.player_names)
+                    self._sorted_hand_cache.clear()
                     self.current_player = self.game.get_current_player()
                     self.show_game_page()
 
@@ -189,85 +196,159 @@ class UnoUI:
     def show_game_page(self):
         """Display the enhanced main game interface."""
         ui.clear()
-        
+
         # Check for game over
         if self.game.is_game_over():
             self._show_winner_page()
             return
-        
+
+        self._build_game_page()
+
+    def _build_game_page(self):
+        """Build the game page once, keeping references for in-place updates.
+
+        The header labels and the three content containers are stored on the
+        instance so _refresh_game_page can patch just what changed instead of
+        clearing and recreating the whole widget tree on every play."""
         # Main game layout with background
         with ui.column().classes("w-full min-h-screen bg-gradient-to-br from-green-50 via-blue-50 to-purple-50"):
-            
+
             # Game header
             with ui.card().classes("w-full p-4 bg-white/90 backdrop-blur-sm shadow-lg"):
                 with ui.row().classes("w-full items-center justify-between"):
                     # Current player indicator
                     current_player_class = "player-turn-indicator bg-gradient-to-r from-blue-500 to-purple-500 text-white p-4 rounded-lg font-bold text-xl"
-                    ui.label(f"🎯 {self.current_player}'s Turn").classes(current_player_class)
-                    
+                    self.turn_label = ui.label(f"🎯 {self.current_player}'s Turn").classes(current_player_class)
+
                     # Game direction
-                    direction_icon = "↻" if self.game.direction == 1 else "↺" 
-                    ui.label(f"Direction: {direction_icon}").classes("text-2xl font-bold text-gray-600")
-                    
+                    direction_icon = "↻" if self.game.direction == 1 else "↺"
+                    self.direction_label = ui.label(f"Direction: {direction_icon}").classes("text-2xl font-bold text-gray-600")
+
                     # Forced draw warning
-                    if self.game.forced_draw > 0:
-                        ui.label(f"⚠️ Must draw {self.game.forced_draw} cards!").classes("text-red-600 font-bold text-xl bg-red-100 p-2 rounded-lg")
+                    self.forced_draw_label = ui.label().classes("text-red-600 font-bold text-xl bg-red-100 p-2 rounded-lg")
+                    self._update_forced_draw_label()
 
             # Main game area
             with ui.row().classes("w-full flex-grow gap-6 p-6"):
-                
+
                 # Left sidebar - Other players
-                self._create_players_sidebar()
-                
+                self.players_container = ui.column().classes("w-80 gap-4")
+                with self.players_container:
+                    self._create_players_sidebar()
+
                 # Center - Game board
                 self._create_game_board()
-                
+
                 # Right sidebar - Current player's hand
-                self._create_player_hand()
+                self.hand_container = ui.column().classes("w-80 gap-4")
+                with self.hand_container:
+                    self._create_player_hand()
+
+        # One pooled color picker per page instead of a fresh dialog per wild
+        self._create_color_dialog()
+
+    def _refresh_game_page(self):
+        """Patch the built page in place after a play or draw.
+
+        Structured as a read pass followed by a write pass: every new value
+        is derived from the game state up front, then all element mutations
+        are applied back to back so they ship to the browser as one batch
+        and settle in a single style/layout pass."""
+        # Read pass - gather everything the write pass needs
+        new_turn = f"🎯 {self.current_player}'s Turn"
+        new_direction = f"Direction: {'↻' if self.game.direction == 1 else '↺'}"
+        forced_draw = self.game.forced_draw
+        top_card = self.game.get_top_card()
+        new_draw_count = f"{len(self.game.draw_pile)} cards"
+
+        # Write pass - no state reads between mutations
+        self.turn_label.set_text(new_turn)
+        self.direction_label.set_text(new_direction)
+        if forced_draw > 0:
+            self.forced_draw_label.set_text(f"⚠️ Must draw {forced_draw} cards!")
+        self.forced_draw_label.set_visibility(forced_draw > 0)
+
+        self._update_players_sidebar()
+
+        self.top_card_container.clear()
+        with self.top_card_container:
+            self._create_top_card_display(top_card)
+        self.draw_count_label.set_text(new_draw_count)
+
+        self.hand_container.clear()
+        with self.hand_container:
+            self._create_player_hand()
+
+    def _update_forced_draw_label(self):
+        """Show the forced-draw warning only while a draw is pending."""
+        if self.game.forced_draw > 0:
+            self.forced_draw_label.set_text(f"⚠️ Must draw {self.game.forced_draw} cards!")
+        self.forced_draw_label.set_visibility(self.game.forced_draw > 0)
 
     def _create_players_sidebar(self):
-        """Create the left sidebar showing other players."""
-        with ui.column().classes("w-80 gap-4"):
-            ui.label("👥 Other Players").classes("text-2xl font-bold text-center text-gray-800 mb-4")
-            
-            player_counts = self.game.get_player_counts()
-            for name, count in player_counts.items():
-                if name != self.current_player:
-                    # Player card with animation
-                    card_class = "p-4 bg-white/80 backdrop-blur-sm shadow-lg hover:shadow-xl transition-all duration-300 transform hover:scale-105"
-                    with ui.card().classes(card_class):
-                        ui.label(f"🎮 {name}").classes("text-lg font-bold text-gray-800")
-                        ui.label(f"Cards: {count}").classes("text-xl text-blue-600 font-semibold")
-                        
-                        # Show warning if player has few cards
-                        if count == 1:
-                            ui.label("🚨 UNO!").classes("text-red-600 font-bold animate-pulse")
-                        elif count <= 3:
-                            ui.label("⚠️ Few cards left").classes("text-orange-600 font-semibold")
+        """Build one status card per player, kept for in-place updates.
+
+        Every player gets a card up front; whose card is visible changes with
+        the turn, and the count/warning labels are patched by
+        _update_players_sidebar instead of rebuilding the column."""
+        ui.label("👥 Other Players").classes("text-2xl font-bold text-center text-gray-800 mb-4")
+
+        self._opponent_widgets = {}
+        self._last_counts = {}
+        player_counts = self.game.get_player_counts()
+        for name, count in player_counts.items():
+            # Player card with animation
+            card_class = "p-4 bg-white/80 backdrop-blur-sm shadow-lg hover:shadow-xl transition-all duration-300 transform hover:scale-105"
+            with ui.card().classes(card_class) as card:
+                ui.label(f"🎮 {name}").classes("text-lg font-bold text-gray-800")
+                count_label = ui.label(f"Cards: {count}").classes("text-xl text-blue-600 font-semibold")
+
+                # Warnings if the player has few cards
+                uno_label = ui.label("🚨 UNO!").classes("text-red-600 font-bold animate-pulse")
+                warn_label = ui.label("⚠️ Few cards left").classes("text-orange-600 font-semibold")
+            card.set_visibility(name != self.current_player)
+            uno_label.set_visibility(count == 1)
+            warn_label.set_visibility(1 < count <= 3)
+            self._opponent_widgets[name] = (card, count_label, uno_label, warn_label)
+            self._last_counts[name] = count
+
+    def _update_players_sidebar(self):
+        """Patch the sidebar cards in place - only changed counts touch labels."""
+        player_counts = self.game.get_player_counts()
+        for name, count in player_counts.items():
+            card, count_label, uno_label, warn_label = self._opponent_widgets[name]
+            card.set_visibility(name != self.current_player)
+            if self._last_counts.get(name) == count:
+                continue
+            count_label.set_text(f"Cards: {count}")
+            uno_label.set_visibility(count == 1)
+            warn_label.set_visibility(1 < count <= 3)
+            self._last_counts[name] = count
 
     def _create_game_board(self):
         """Create the central game board with top card and draw pile."""
         with ui.column().classes("flex-grow items-center gap-8"):
-            
+
             # Top card display
             with ui.column().classes("items-center gap-4"):
                 ui.label("🎯 Top Card").classes("text-2xl font-bold text-gray-800")
-                
-                top_card = self.game.get_top_card()
-                self._create_top_card_display(top_card)
-            
+
+                self.top_card_container = ui.column().classes("items-center")
+                with self.top_card_container:
+                    self._create_top_card_display(self.game.get_top_card())
+
             # Draw pile
             with ui.column().classes("items-center gap-4"):
                 ui.label("🂠 Draw Pile").classes("text-xl font-bold text-gray-700")
-                
+
                 def draw_card():
                     self._handle_draw_card()
-                
+
                 draw_pile_class = "w-32 h-48 bg-gradient-to-br from-gray-600 to-gray-800 text-white font-bold text-lg rounded-xl shadow-lg cursor-pointer hover:shadow-2xl transition-all duration-300 transform hover:scale-105 flex flex-col items-center justify-center"
-                
+
                 with ui.card().classes(draw_pile_class).on('click', draw_card):
                     ui.label("DRAW").classes("text-2xl font-bold")
-                    ui.label(f"{len(self.game.draw_pile)} cards").classes("text-sm")
+                    self.draw_count_label = ui.label(f"{len(self.game.draw_pile)} cards").classes("text-sm")
 
     def _create_top_card_display(self, card: Card):
         """Create an enhanced display for the top card."""
@@ -285,89 +366,129 @@ class UnoUI:
         
         with ui.card().classes(card_class):
             # Card symbol/number
-            ui.label(str(card)).classes("text-4xl font-bold mb-2")
-            
+            ui.label(_card_str(card)).classes("text-4xl font-bold mb-2")
+
             # Color name for wild cards
             if card.color == Color.WILD and self.game.current_color:
-                ui.label(f"Color: {self.game.current_color.value.title()}").classes("text-sm font-semibold bg-white/20 px-2 py-1 rounded")
+                ui.label(f"Color: {_COLOR_TITLE[self.game.current_color]}").classes("text-sm font-semibold bg-white/20 px-2 py-1 rounded")
             elif card.color != Color.WILD:
-                ui.label(card.color.value.title()).classes("text-sm font-semibold bg-white/20 px-2 py-1 rounded")
+                ui.label(_COLOR_TITLE[card.color]).classes("text-sm font-semibold bg-white/20 px-2 py-1 rounded")
 
     def _create_player_hand(self):
-        """Create the right sidebar showing current player's hand."""
-        with ui.column().classes("w-80 gap-4"):
-            ui.label(f"🃏 {self.current_player}'s Hand").classes("text-2xl font-bold text-center text-gray-800")
-            
-            hand = self.game.get_player_hand(self.current_player)
-            ui.label(f"Cards: {len(hand)}").classes("text-lg text-center text-gray-600 mb-4")
-            
-            # Sort hand for better organization
-            sorted_hand = sorted(hand, key=lambda card: card.get_sort_key())
-            
-            with ui.scroll_area().classes("h-[600px] p-2"):
-                for i, card in enumerate(sorted_hand):
-                    original_index = hand.index(card)
-                    self._create_hand_card(card, original_index, i)
+        """Fill the hand sidebar with the current player's cards."""
+        # Bind the hot attributes once - inside the per-card loop LOAD_FAST
+        # locals beat repeated self.<attr> chains
+        game = self.game
+        create_hand_card = self._create_hand_card
+
+        ui.label(f"🃏 {self.current_player}'s Hand").classes("text-2xl font-bold text-center text-gray-800")
+
+        hand = game.get_player_hand(self.current_player)
+        ui.label(f"Cards: {len(hand)}").classes("text-lg text-center text-gray-600 mb-4")
 
-    def _create_hand_card(self, card: Card, original_index: int, display_index: int):
+        # Sort hand for better organization, carrying the original index along -
+        # recovering it afterwards with hand.index() would be quadratic and
+        # would return the wrong slot for duplicate cards. Most refreshes
+        # (opponent turns, color picks) leave the hand untouched, so the sorted
+        # view is cached against an identity fingerprint and only rebuilt when
+        # a card actually enters or leaves the hand.
+        fingerprint = tuple(id(card) for card in hand)
+        cached = self._sorted_hand_cache.get(self.current_player)
+        if cached is not None and cached[0] == fingerprint:
+            indexed = cached[1]
+        else:
+            indexed = sorted(enumerate(hand), key=lambda ic: ic[1].get_sort_key())
+            self._sorted_hand_cache[self.current_player] = (fingerprint, indexed)
+
+        # The state feeding playability is constant for this render, so read
+        # it once and build a local predicate instead of re-deriving it from
+        # the game for every card
+        if game.forced_draw > 0:
+            def is_playable(c):
+                return c.type == CardType.DRAW_TWO
+        else:
+            top_card = game.get_top_card()
+            cur_color = game.current_color
+            top_type, top_value = top_card.type, top_card.value
+
+            def is_playable(c):
+                return (c.type in (CardType.WILD, CardType.WILD_DRAW)
+                        or c.color == cur_color
+                        or c.type == top_type
+                        or (c.type == CardType.NUMBER and top_type == CardType.NUMBER and c.value == top_value))
+
+        with ui.scroll_area().classes("h-[600px] p-2"):
+            for display_index, (original_index, card) in enumerate(indexed):
+                create_hand_card(card, original_index, display_index, is_playable(card))
+
+    def _create_hand_card(self, card: Card, original_index: int, display_index: int, playable: bool):
         """Create a single card in the player's hand."""
-        style = self.color_styles.get(card.color, self.color_styles[Color.RED])
-        playable = self._is_card_playable(card)
+        # Card styling based on playability - a dict lookup into the class
+        # strings prebuilt at import time
+        card_class = _PLAYABLE_CARD_CLASS[card.color] if playable else _DISABLED_CARD_CLASS
         
-        # Card styling based on playability
-        if playable:
-            if card.color == Color.WILD:
-                card_class = f"uno-card w-full h-24 wild-card-gradient text-white rounded-xl shadow-lg flex items-center justify-between p-4 mb-2 border-2 border-green-400"
-            else:
-                card_class = f"uno-card w-full h-24 {style['bg']} {style['text']} rounded-xl shadow-lg flex items-center justify-between p-4 mb-2 border-2 border-green-400 {style['hover']}"
+        # The face is purely presentational: rendering it as one ui.html child
+        # creates a single element (and DOM patch) per card instead of a
+        # column plus three labels, trimming the per-card rebuild path
+        if card.color == Color.WILD:
+            color_line = ''
         else:
-            card_class = f"uno-card-disabled w-full h-24 bg-gray-300 text-gray-500 rounded-xl shadow-lg flex items-center justify-between p-4 mb-2 border-2 border-gray-400"
-        
-        with ui.card().classes(card_class):
-            # Card info
-            with ui.column().classes("gap-1"):
-                ui.label(f"#{display_index + 1}").classes("text-xs font-bold opacity-70")
-                ui.label(str(card)).classes("text-xl font-bold")
-                if card.color != Color.WILD:
-                    ui.label(card.color.value.title()).classes("text-xs font-semibold")
-            
+            color_line = f'<div class="text-xs font-semibold">{_COLOR_TITLE[card.color]}</div>'
+
+        with ui.card().classes(card_class) as card_element:
+            ui.html(_HAND_CARD_FACE(
+                n=display_index + 1,
+                text=_card_str(card),
+                color=color_line,
+            ))
+
             # Play button
             if playable:
-                def play_card(idx=original_index):
-                    self._handle_play_card(idx)
-                
+                def play_card(idx=original_index, element=card_element):
+                    self._handle_play_card(idx, element)
+
                 play_btn_class = "bg-white/20 hover:bg-white/30 text-current font-bold py-2 px-4 rounded-lg transition-all duration-300 transform hover:scale-105"
                 ui.button("PLAY", on_click=play_card).classes(play_btn_class)
 
-    def _handle_play_card(self, card_index: int):
+    def _handle_play_card(self, card_index: int, card_element=None):
         """Handle playing a card with enhanced feedback."""
         hand = self.game.get_player_hand(self.current_player)
         card = hand[card_index]
-        
+
         # Handle wild cards
         if card.type in (CardType.WILD, CardType.WILD_DRAW):
             self._show_color_picker(card_index)
             return
-        
+
+        # Optimistic feedback: fade the clicked card out immediately so the
+        # play feels instant - the coalesced page patch follows shortly, and
+        # the rejection branches below roll the fade back
+        if card_element is not None:
+            card_element.classes(add='uno-card-played')
+
         # Handle forced draw scenario
         if self.game.forced_draw > 0:
             if card.type == CardType.DRAW_TWO:
                 # Allow stacking +2 cards
                 success, message = self.game.play_card(
-                    list(self.game.players.keys()).index(self.current_player),
+                    self.game.current_player,
                     card_index
                 )
                 if success:
                     ui.notify(f"Stacked +2! Next player must draw {self.game.forced_draw} cards!", type='positive')
                 else:
+                    if card_element is not None:
+                        card_element.classes(remove='uno-card-played')
                     ui.notify(message or "Cannot play that card!", type='negative')
             else:
+                if card_element is not None:
+                    card_element.classes(remove='uno-card-played')
                 ui.notify(f"You must draw {self.game.forced_draw} cards first or play a +2 to stack!", type='warning')
                 return
         else:
             # Normal card play
             success, message = self.game.play_card(
-                list(self.game.players.keys()).index(self.current_player),
+                self.game.current_player,
                 card_index
             )
             
@@ -377,57 +498,69 @@ class UnoUI:
                 else:
                     ui.notify(f"Played {card}!", type='positive')
             else:
+                if card_element is not None:
+                    card_element.classes(remove='uno-card-played')
                 ui.notify(message or "Cannot play that card!", type='negative')
-        
+
         self.update_game_state()
 
     def _handle_draw_card(self):
         """Handle drawing cards with enhanced feedback."""
         if self.game.forced_draw > 0:
             # Handle forced draw
-            drawn = self.game.handle_forced_draw(list(self.game.players.keys()).index(self.current_player))
+            drawn = self.game.handle_forced_draw(self.game.current_player)
             ui.notify(f"Drew {len(drawn)} cards due to special card effect!", type='info')
         else:
             # Normal draw
-            drawn = self.game.draw_card(list(self.game.players.keys()).index(self.current_player))
+            drawn = self.game.draw_card(self.game.current_player)
             ui.notify(f"Drew {len(drawn)} card{'s' if len(drawn) > 1 else ''}!", type='info')
         
         self.game._next_turn()
         self.update_game_state()
 
-    def _show_color_picker(self, card_index: int):
-        """Show an enhanced color picker dialog for wild cards."""
-        with ui.dialog() as dialog, ui.card().classes("p-6 bg-white/95 backdrop-blur-sm"):
+    def _create_color_dialog(self):
+        """Build the wild-card color picker once per page.
+
+        Every wild play used to construct a fresh dialog with four color
+        buttons and discard it on close; the pooled dialog is just reopened
+        with the pending hand index stashed on the instance."""
+        with ui.dialog() as self._color_dialog, ui.card().classes("p-6 bg-white/95 backdrop-blur-sm"):
             ui.label("🌈 Choose your color").classes("text-3xl font-bold text-center mb-6 bg-gradient-to-r from-purple-600 to-pink-600 bg-clip-text text-transparent")
 
             with ui.grid(columns=2).classes("gap-6 justify-center"):
-                colors = [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]
-                
-                for color in colors:
+                for color in (Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW):
                     style = self.color_styles[color]
-                    
-                    def on_color_select(c=color, idx=card_index):
-                        success, message = self.game.play_card(
-                            self.get_current_player_index(),
-                            idx,
-                            c
-                        )
-                        if success:
-                            if message:  # Win message
-                                ui.notify(message, type='positive')
-                            else:
-                                ui.notify(f"Played wild card! Color changed to {c.value.title()}!", type='positive')
-                            dialog.close()
-                            self.update_game_state()
-                        else:
-                            ui.notify(message or "Couldn't play that card!", type='negative')
-                    
                     color_btn_class = f"w-24 h-24 rounded-xl shadow-lg font-bold text-xl transition-all duration-300 transform hover:scale-110 {style['hover']} flex items-center justify-center cursor-pointer"
-                    
-                    with ui.card().classes(color_btn_class).on('click', lambda c=color: on_color_select(c)):
-                        ui.label(color.value.title()).classes("font-bold text-center")
 
-            dialog.open()
+                    with ui.card().classes(color_btn_class).on('click', lambda c=color: self._apply_wild_color(c)):
+                        ui.label(_COLOR_TITLE[color]).classes("font-bold text-center")
+
+    def _apply_wild_color(self, color: Color):
+        """Play the pending wild card with the chosen color."""
+        card_index = self._pending_wild_index
+        if card_index is None:
+            return
+
+        success, message = self.game.play_card(
+            self.get_current_player_index(),
+            card_index,
+            color
+        )
+        if success:
+            if message:  # Win message
+                ui.notify(message, type='positive')
+            else:
+                ui.notify(f"Played wild card! Color changed to {_COLOR_TITLE[color]}!", type='positive')
+            self._pending_wild_index = None
+            self._color_dialog.close()
+            self.update_game_state()
+        else:
+            ui.notify(message or "Couldn't play that card!", type='negative')
+
+    def _show_color_picker(self, card_index: int):
+        """Open the pooled color picker for a wild card."""
+        self._pending_wild_index = card_index
+        self._color_dialog.open()
 
     def _show_winner_page(self):
         """Display the winner announcement page."""
@@ -469,6 +602,7 @@ class UnoUI:
                     def same_players():
                         if self.player_names:
                             self.game = UnoGame(self.player_names)
+                            self._sorted_hand_cache.clear()
                             self.current_player = self.game.get_current_player()
                             self.show_game_page()
                     
@@ -477,27 +611,29 @@ class UnoUI:
                     if self.player_names:
                         ui.button("🔄 Play Again", on_click=same_players).classes("p-4 text-lg font-bold bg-gradient-to-r from-green-500 to-blue-500 text-white hover:from-green-600 hover:to-blue-600")
 
-    def _is_card_playable(self, card: Card) -> bool:
-        """Check if a card is playable (enhanced logic)."""
-        # During forced draw, only +2 cards can be played (for stacking)
-        if self.game.forced_draw > 0:
-            return card.type == CardType.DRAW_TWO
-        
-        # Wild cards are always playable
-        if card.type in (CardType.WILD, CardType.WILD_DRAW):
-            return True
-        
-        top_card = self.game.get_top_card()
-        
-        return (card.color == self.game.current_color or
-                card.type == top_card.type or
-                (card.type == CardType.NUMBER and top_card.type == CardType.NUMBER and card.value == top_card.value))
-
     def update_game_state(self):
-        """Update the game state and refresh the UI."""
+        """Schedule a UI refresh, coalescing bursts into one render pass.
+
+        Rapid clicks (or a bot driving the UI) can request several refreshes
+        in quick succession; a 50 ms one-shot timer batches them so the page
+        is only patched once per burst."""
+        if self._pending_refresh:
+            return
+        self._pending_refresh = True
+        ui.timer(0.05, self._do_refresh, once=True)
+
+    def _do_refresh(self):
+        """Apply the pending refresh against the latest game state.
+
+        The built page is patched in place; a full show_game_page rebuild only
+        happens for page transitions (first entry, game over)."""
+        self._pending_refresh = False
         if self.game and not self.game.is_game_over():
             self.current_player = self.game.get_current_player()
-        self.show_game_page()
+        if self.game is None or self.game.is_game_over() or self.hand_container is None:
+            self.show_game_page()
+        else:
+            self._refresh_game_page()
 
     def run(self, title: str = "🎮 UNO Game - Modern Web Edition", port: int = 8080, debug: bool = False):
         """Run the enhanced UI application."""
@@ -518,10 +654,7 @@ class UnoUI:
 
     def get_current_player_index(self) -> int:
         """Get the current player's index in the game players list."""
-        if not self.player_name or not self.game:
+        if not self.game:
             return -1
-        try:
-            return list(self.game.players.keys()).index(self.current_player)
-        except ValueError:
-            # Player not found in game
-            return -1
\ No newline at end of file
+        # The game already tracks the current player's position directly
+        return self.game.current_player
\ No newline at end of file
@@ -2,7 +2,10 @@
 Base UI class and shared utilities for UNO game interface.
 """
 
-from typing import Optional
+from __future__ import annotations
+
+import asyncio
+import threading
 from nicegui import ui, app
 
 from ..game import UnoGame, Card, Color, CardType
@@ -12,17 +15,22 @@ class UnoUIBase:
     """Base class for UNO UI with shared state and utilities."""
     
     # Global game state (shared across all sessions)
+    _lock = threading.RLock()  # Guards _lobby_players / _player_heartbeats mutations
     _lobby_players = {}  # {player_name: ready_status}
     _player_heartbeats = {}  # {player_name: last_heartbeat_timestamp}
+    _heartbeat_heap = []  # Min-heap of (timestamp, player_name); stale entries filtered lazily
+    _connected_players = set()  # Names with an open NiceGUI session right now
     _game_started = False
     _game_hash = None  # Current game session hash
     _game_instance = None  # Shared game instance
     _heartbeat_timeout = 30  # Remove players after 30 seconds of inactivity
+    _state_version = 0  # Bumped on every shared-state mutation
+    _state_changed = asyncio.Event()  # Wakes push-driven page watchers
     
     def __init__(self):
-        self._active_dialog = False
+        self._dialog_event = asyncio.Event()  # Set while a modal dialog is open
         self.current_player = None
-        
+
         # Color mappings for beautiful card styling
         self.color_styles = {
             Color.RED: {"bg": "bg-red-500", "text": "text-white", "border": "border-red-600"},
@@ -38,6 +46,26 @@ class UnoUIBase:
             Color.YELLOW: "yellow",
             Color.WILD: "white"
         }
+
+        # Card class strings are static per color - build them once here.
+        # Geometry, color faces and playability states are named classes in
+        # static/uno.css, so each card ships a few short names over the wire
+        # instead of the full Tailwind utility string
+        self._playable_card_class = {
+            c: f"uno-card uno-horiz uno-{c.name.lower()} uno-playable"
+            for c in self.color_styles
+        }
+        self._disabled_card_class = {
+            c: f"uno-card-disabled uno-horiz uno-{c.name.lower()} uno-disabled"
+            for c in self.color_styles
+        }
+        self._wild_playable_class = "uno-card uno-horiz wild-card-gradient text-white uno-playable"
+        self._wild_disabled_class = "uno-card-disabled uno-horiz wild-card-gradient text-white uno-disabled"
+        self._header_class_by_color = {
+            c: f"uno-header-card uno-{c.name.lower()}"
+            for c in self.color_styles
+        }
+        self._header_wild_class = "uno-header-card wild-card-gradient text-white border-purple-300"
     
     @property
     def game(self):
@@ -69,18 +97,42 @@ class UnoUIBase:
         """Set the current game stage for this session."""
         app.storage.user['game_stage'] = value
 
+    @classmethod
+    def bump_state(cls):
+        """Signal all connected clients that shared state changed.
+
+        Page watchers block on _state_changed instead of polling, so one call
+        here wakes every client exactly once per real mutation. The event is
+        cleared right after set(); waiters woken by set() are already
+        scheduled, and late arrivals compare _state_version instead."""
+        cls._state_version += 1
+        cls._state_changed.set()
+        cls._state_changed.clear()
+
+    @classmethod
+    async def wait_for_state_change(cls, version: int, timeout: float = 10.0):
+        """Wait until the shared state moves past ``version`` (or keepalive).
+
+        The timeout doubles as a heartbeat keepalive: it stays well below the
+        30-second inactivity window so a quiet lobby still refreshes its
+        heartbeats in time. Returns the current state version."""
+        if cls._state_version == version:
+            try:
+                await asyncio.wait_for(cls._state_changed.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        return cls._state_version
+
     def update_game_state(self):
         """Update the game state and refresh UI."""
         if self.game and not self.game.is_game_over():
             self.current_player = self.game.get_current_player()
-        # The timer will handle the UI refresh automatically
+        # Wake every client's watcher so all sessions re-render the new state
+        UnoUIBase.bump_state()
 
     def get_player_index(self) -> int:
         """Get the current player's index in the game players list."""
         if not self.player_name or not self.game:
             return -1
-        try:
-            return list(self.game.players.keys()).index(self.player_name)
-        except ValueError:
-            # Player not found in game
-            return -1
+        # The game keeps a name->index mapping for its fixed player set
+        return self.game.player_index(self.player_name)
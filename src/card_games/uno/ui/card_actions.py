@@ -9,11 +9,30 @@ from .components import CardComponents
 from ..game import Card, Color, CardType
 
 
+# Compact ordinals for the four pickable colors, so per-color counting can
+# index a flat list instead of hashing Color members into a dict
+_COLOR_IX = {Color.RED: 0, Color.BLUE: 1, Color.GREEN: 2, Color.YELLOW: 3}
+
+# The two card types that open the color picker
+_WILD_TYPES = frozenset({CardType.WILD, CardType.WILD_DRAW})
+
+# Pre-bound template for the static face of a hand card - parsed once at
+# import instead of assembling three f-strings per card per render
+_CARD_FACE = (
+    '<div class="text-xs opacity-70 mb-1">#{n}</div>'
+    '<div class="text-2xl font-bold mb-1">{text}</div>'
+    '<div class="text-xs font-semibold">{color}</div>'
+).format
+
+
 class CardActions:
     """Handles card playing and game actions."""
     
     def __init__(self, ui_instance: UnoUIBase):
         self.ui = ui_instance
+        self._playable_ids = frozenset()  # Precomputed playable-card mask
+        self._color_dialogs = {}  # {client id: (dialog, {Color: button})}
+        self._pending_wild_index = None  # Hand index of the wild being played
 
     def draw_card(self):
         """Draw cards - only if it's the viewing player's turn."""
@@ -42,22 +61,25 @@ class CardActions:
         self.ui.current_player = self.ui.game.get_current_player()
         self.ui.update_game_state()
 
-    def play_card(self, card_index: int):
-        """Play a card - only if it's the viewing player's turn."""
+    def play_card(self, card_index: int, card: Card = None):
+        """Play a card - only if it's the viewing player's turn.
+
+        Callers that already resolved the card object pass it along, saving a
+        second hand fetch per click."""
         if not self.ui.player_name or self.ui.current_player != self.ui.player_name:
             ui.notify("It's not your turn!", type='warning')
             return
-        
+
         player_index = self.ui.get_player_index()
         if player_index == -1:
             ui.notify("Player not found in game!", type='error')
             return
-            
-        hand = self.ui.game.get_player_hand(self.ui.player_name)
-        card = hand[card_index]
+
+        if card is None:
+            card = self.ui.game.get_player_hand(self.ui.player_name)[card_index]
         
         # Handle wild cards
-        if card.type in (CardType.WILD, CardType.WILD_DRAW):
+        if card.type in _WILD_TYPES:
             self._show_color_picker(card_index)
             return
         
@@ -91,75 +113,128 @@ class CardActions:
         
         self.ui.update_game_state()
 
+    def play_card_by_ref(self, card: Card):
+        """Play a specific card object, resolving its hand index at click time.
+
+        Click handlers keep elements alive across in-place hand patches, so a
+        captured index could point at the wrong slot once other cards leave
+        the hand - the card identity stays valid.
+        """
+        hand = self.ui.game.get_player_hand(self.ui.player_name)
+        for index, held in enumerate(hand):
+            if held is card:
+                self.play_card(index, card)
+                return
+        ui.notify("That card is no longer in your hand!", type='warning')
+
+    def recompute_playable(self, hand=None):
+        """Precompute which hand cards are playable for the current state.
+
+        The turn, forced draw and top card are read once per refresh instead
+        of once per card per render; is_card_playable then reduces to a set
+        membership test. Callers holding a hand snapshot pass it in."""
+        # Only allow playing if it's the viewing player's turn
+        if not self.ui.player_name or not self.ui.game or self.ui.current_player != self.ui.player_name:
+            self._playable_ids = frozenset()
+            return
+
+        game = self.ui.game
+        if hand is None:
+            hand = game.get_player_hand(self.ui.player_name)
+
+        if game.forced_draw > 0:
+            self._playable_ids = frozenset(
+                id(card) for card in hand if card.type == CardType.DRAW_TWO
+            )
+            return
+
+        top_card = game.get_top_card()
+        current_color = game.current_color
+        self._playable_ids = frozenset(
+            id(card) for card in hand
+            if card.type in _WILD_TYPES
+            or card.color == current_color
+            or card.type == top_card.type
+            or (card.type == CardType.NUMBER and top_card.type == CardType.NUMBER and card.value == top_card.value)
+        )
+
     def is_card_playable(self, card: Card) -> bool:
         """Check if a card is playable."""
-        # Only allow playing if it's the viewing player's turn
-        if not self.ui.player_name or self.ui.current_player != self.ui.player_name:
-            return False
-            
-        if self.ui.game.forced_draw > 0:
-            return card.type == CardType.DRAW_TWO
-        
-        if card.type in (CardType.WILD, CardType.WILD_DRAW):
-            return True
-        
-        top_card = self.ui.game.get_top_card()
-        return (card.color == self.ui.game.current_color or
-                card.type == top_card.type or
-                (card.type == CardType.NUMBER and top_card.type == CardType.NUMBER and card.value == top_card.value))
+        return id(card) in self._playable_ids
+
+    def _get_color_dialog(self):
+        """Build the color-picker dialog once per client and reuse it.
+
+        Every wild play used to create a fresh dialog with four buttons and
+        leave the old one for garbage collection; the pooled dialog is only
+        reopened with updated button labels."""
+        client_id = ui.context.client.id
+        entry = self._color_dialogs.get(client_id)
+        if entry is not None:
+            return entry
+
+        with ui.dialog() as dialog, ui.card().classes("p-6"):
+            ui.label("🌈 Choose a Color X").classes("text-2xl font-bold text-center mb-4")
+
+            buttons = {}
+            with ui.grid(columns=2).classes("gap-4"):
+                for color in (Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW):
+                    style = self.ui.color_styles[color]
+                    buttons[color] = ui.button(
+                        color.value.title(),
+                        on_click=lambda c=color: self._select_color(c)
+                    ).classes(f"p-4 {style['bg']} {style['text']} font-bold rounded-lg hover:scale-105 transition-all duration-300 shadow-lg")
+
+        entry = (dialog, buttons)
+        self._color_dialogs[client_id] = entry
+        return entry
+
+    def _select_color(self, color: Color):
+        """Play the pending wild card with the chosen color."""
+        card_index = self._pending_wild_index
+        if card_index is None:
+            return
+
+        dialog, _ = self._get_color_dialog()
+        success, message = self.ui.game.play_card(
+            self.ui.get_player_index(),
+            card_index,
+            color
+        )
+        if success:
+            # Update current player immediately after successful play
+            self.ui.current_player = self.ui.game.get_current_player()
+            ui.notify(f"Played wild! Color: {color.value.title()}!" if not message else message, type='positive')
+            self._pending_wild_index = None
+            dialog.close()
+            self.ui._dialog_event.clear()
+            self.ui.update_game_state()
+        else:
+            ui.notify(message or "Cannot play that card!", type='negative')
+            self.ui._dialog_event.clear()
 
     def _show_color_picker(self, card_index: int):
         """Show color picker for wild cards."""
-        self.ui._active_dialog = True
-        
         player_index = self.ui.get_player_index()
         if player_index == -1:
             ui.notify("Player not found in game!", type='error')
-            self.ui._active_dialog = False
             return
 
-        with ui.dialog() as dialog, ui.card().classes("p-6"):
-            ui.label("🌈 Choose a Color X").classes("text-2xl font-bold text-center mb-4")
+        self.ui._dialog_event.set()
+        self._pending_wild_index = card_index
+        dialog, buttons = self._get_color_dialog()
 
-            # Get current player's hand to count cards by color
-            hand = self.ui.game.get_player_hand(self.ui.player_name)
-            color_counts = {}
-            
-            # Count cards by color (excluding wild cards)
-            for card in hand:
-                if card.color != Color.WILD:
-                    color_counts[card.color] = color_counts.get(card.color, 0) + 1
-
-            with ui.grid(columns=2).classes("gap-4"):
-                colors = [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]
-                
-                for color in colors:
-                    style = self.ui.color_styles[color]
-                    card_count = color_counts.get(color, 0)
-                    
-                    def select_color(c=color):
-                        success, message = self.ui.game.play_card(
-                            player_index,
-                            card_index,
-                            c
-                        )
-                        if success:
-                            # Update current player immediately after successful play
-                            self.ui.current_player = self.ui.game.get_current_player()
-                            ui.notify(f"Played wild! Color: {c.value.title()}!" if not message else message, type='positive')
-                            dialog.close()
-                            self.ui._active_dialog = False
-                            self.ui.update_game_state()
-                        else:
-                            ui.notify(message or "Cannot play that card!", type='negative')                            
-                            self.ui._active_dialog = False
-                    
-                    ui.button(
-                        f"{color.value.title()} ({card_count})",
-                        on_click=select_color
-                    ).classes(f"p-4 {style['bg']} {style['text']} font-bold rounded-lg hover:scale-105 transition-all duration-300 shadow-lg")
+        # Refresh the per-color card counts (excluding wild cards) before reopening
+        hand = self.ui.game.get_player_hand(self.ui.player_name)
+        counts = [0, 0, 0, 0]
+        for card in hand:
+            ix = _COLOR_IX.get(card.color, -1)
+            if ix >= 0:
+                counts[ix] += 1
+        for color, button in buttons.items():
+            button.set_text(f"{color.value.title()} ({counts[_COLOR_IX[color]]})")
 
-            dialog.open()
+        dialog.open()
 
 
 class HandDisplay:
@@ -168,54 +243,100 @@ class HandDisplay:
     def __init__(self, ui_instance: UnoUIBase, card_actions: CardActions):
         self.ui = ui_instance
         self.card_actions = card_actions
+        self._card_elements = {}  # {id(card): ui.card} for in-place patching
+        self._playable_ids = frozenset()  # Playability snapshot of the last render
 
-    def create_horizontal_hand(self):
+    def create_horizontal_hand(self, hand=None):
         """Create the player's hand in a horizontal row."""
         if not self.ui.player_name:
             return
-            
-        hand = self.ui.game.get_player_hand(self.ui.player_name)
+
+        # Click handlers resolve cards by identity, so the sorted view does not
+        # need to track original hand indexes
+        if hand is None:
+            hand = self.ui.game.get_player_hand(self.ui.player_name)
         sorted_hand = sorted(hand, key=lambda card: card.get_sort_key())
-        
-        with ui.row().classes("flex-wrap justify-center gap-2 p-4"):
-            for i, card in enumerate(sorted_hand):
-                original_index = hand.index(card)
-                self._create_horizontal_card(card, original_index, i)
-
-    def _create_horizontal_card(self, card: Card, original_index: int, display_index: int):
-        """Create a single card in horizontal layout."""
-        style = self.ui.color_styles.get(card.color, self.ui.color_styles[Color.RED])
-        playable = self.card_actions.is_card_playable(card) and (self.ui.current_player == self.ui.player_name)
-        
+
+        self._card_elements = {}
+        self._playable_ids = frozenset(
+            id(card) for card in hand if self.card_actions.is_card_playable(card)
+        )
+        row = ui.row().classes("flex-wrap justify-center gap-2 p-4")
+        # One delegated click listener for the whole row instead of two
+        # handlers per card; only playable cards carry a data-idx attribute,
+        # so clicks elsewhere never even reach the server
+        row.on(
+            'click',
+            self._on_hand_click,
+            js_handler='(e) => { const card = e.target.closest("[data-idx]"); if (card) emit(card.dataset.idx); }',
+        )
+        with row:
+            for display_index, card in enumerate(sorted_hand):
+                self._card_elements[id(card)] = self._create_horizontal_card(card, display_index)
+
+    def _on_hand_click(self, e):
+        """Delegated click handler for the hand row."""
+        try:
+            card_id = int(e.args)
+        except (TypeError, ValueError):
+            return
+        hand = self.ui.game.get_player_hand(self.ui.player_name)
+        for card in hand:
+            if id(card) == card_id:
+                self.card_actions.play_card_by_ref(card)
+                return
+
+    def patch_hand(self, hand=None) -> bool:
+        """Try to update the rendered hand in place; return False if a full
+        rebuild is required.
+
+        Cards that left the hand are deleted individually - the common case of
+        playing one card then only removes one element instead of wiping and
+        recreating the whole row. New cards or playability changes still need
+        a rebuild because styling, ordering and click handlers differ.
+        """
+        if hand is None:
+            hand = self.ui.game.get_player_hand(self.ui.player_name)
+        current_ids = {id(card) for card in hand}
+        playable_ids = frozenset(
+            id(card) for card in hand if self.card_actions.is_card_playable(card)
+        )
+        added = current_ids - self._card_elements.keys()
+        if added or playable_ids != self._playable_ids & current_ids:
+            return False
+
+        for card_id in list(self._card_elements.keys() - current_ids):
+            self._card_elements.pop(card_id).delete()
+        self._playable_ids = playable_ids
+        return True
+
+    def _create_horizontal_card(self, card: Card, display_index: int):
+        """Create a single card in horizontal layout and return its element."""
+        # The playability mask is empty when it is not this player's turn, so
+        # no separate per-card turn check is needed
+        playable = self.card_actions.is_card_playable(card)
+
         # Card styling - always show color, but indicate playability with border
         if card.color == Color.WILD:
-            if playable:
-                card_class = "uno-card w-24 h-36 wild-card-gradient text-white rounded-xl shadow-lg border-4 border-green-400 flex flex-col items-center justify-center"
-            else:
-                card_class = "uno-card-disabled w-24 h-36 wild-card-gradient text-white rounded-xl shadow-lg border-2 border-gray-400 flex flex-col items-center justify-center opacity-75"
+            card_class = self.ui._wild_playable_class if playable else self.ui._wild_disabled_class
         else:
-            if playable:
-                card_class = f"uno-card w-24 h-36 {style['bg']} {style['text']} rounded-xl shadow-lg border-4 border-green-400 flex flex-col items-center justify-center"
-            else:
-                card_class = f"uno-card-disabled w-24 h-36 {style['bg']} {style['text']} rounded-xl shadow-lg border-2 border-gray-400 flex flex-col items-center justify-center opacity-75"
+            card_class = (self.ui._playable_card_class if playable else self.ui._disabled_card_class)[card.color]
         
+        # The face is purely presentational, so the three labels collapse into
+        # one ui.html child: one server-side object and one DOM patch per card
+        # instead of three of each
+        color_name = "Wild" if card.color == Color.WILD else card.color.value.title()
         with ui.card().classes(card_class) as card_element:
-            # Card number (small, at top)
-            ui.label(f"#{display_index + 1}").classes("text-xs opacity-70 mb-1")
-            
-            # Card value (large, center) - use custom display method
-            ui.label(CardComponents.get_card_display_text(card)).classes("text-2xl font-bold mb-1")
-            
-            # Color name (small, at bottom) - always show color
-            if card.color != Color.WILD:
-                ui.label(card.color.value.title()).classes("text-xs font-semibold")
-            else:
-                ui.label("Wild").classes("text-xs font-semibold")
-            
-            # Play button (only if playable and my turn)
-            if playable:
-                ui.button("PLAY", on_click=lambda idx=original_index: self.card_actions.play_card(idx)).classes("mt-2 bg-white/30 hover:bg-white/50 font-bold py-1 px-2 rounded text-xs")
-            
-            # Make entire card clickable if playable
-            if playable:
-                card_element.on('click', lambda idx=original_index: self.card_actions.play_card(idx))
+            ui.html(_CARD_FACE(
+                n=display_index + 1,
+                text=CardComponents.get_card_display_text(card),
+                color=color_name,
+            )).classes("text-center")
+
+
+        # Tag playable cards for the delegated row listener; the whole card is
+        # the click target, so no per-card button or handler is needed
+        if playable:
+            card_element.props(f'data-idx={id(card)}')
+
+        return card_element
@@ -7,81 +7,82 @@ from nicegui import ui
 from ..game import Card, Color, CardType
 
 
+# Fully assembled class strings per Color, filled lazily on first use -
+# card renderers run per card per refresh, so the f-string assembly should
+# happen once per color rather than once per render
+_MINI_CARD_CLASS = {}
+_DISCARD_CARD_TEMPLATE = {}
+
+# Display text per (card type, value), built once - replaces the elif chains
+# that ran for every card on every refresh (action cards carry value None)
+_DISPLAY_TEXT = {(CardType.NUMBER, v): str(v) for v in range(10)}
+_DISPLAY_TEXT.update({
+    (CardType.WILD, None): "🌈",
+    (CardType.WILD_DRAW, None): "🌈+4",
+    (CardType.DRAW_TWO, None): "+2",
+    (CardType.SKIP, None): "⊘",
+    (CardType.REVERSE, None): "⟲",
+})
+_MINI_TEXT = dict(_DISPLAY_TEXT)
+_MINI_TEXT[(CardType.WILD_DRAW, None)] = "+4"
+
+
 class CardComponents:
     """Components for displaying UNO cards."""
     
     @staticmethod
     def get_card_display_text(card: Card) -> str:
         """Get display text for a card with better formatting."""
-        if card.type == CardType.NUMBER:
-            return str(card.value)
-        elif card.type == CardType.WILD:
-            return "🌈"
-        elif card.type == CardType.WILD_DRAW:
-            return "🌈+4"
-        elif card.type == CardType.DRAW_TWO:
-            return "+2"
-        elif card.type == CardType.SKIP:
-            return "⊘"
-        elif card.type == CardType.REVERSE:
-            return "⟲"
-        else:
-            return str(card)
+        text = _DISPLAY_TEXT.get((card.type, card.value))
+        return text if text is not None else str(card)
 
     @staticmethod
     def get_mini_card_text(card: Card) -> str:
         """Get abbreviated text for mini cards."""
-        if card.type == CardType.NUMBER:
-            return str(card.value)
-        elif card.type == CardType.WILD:
-            return "🌈"
-        elif card.type == CardType.WILD_DRAW:
-            return "+4"
-        elif card.type == CardType.DRAW_TWO:
-            return "+2"
-        elif card.type == CardType.SKIP:
-            return "⊘"
-        elif card.type == CardType.REVERSE:
-            return "⟲"
-        else:
-            return "?"
+        return _MINI_TEXT.get((card.type, card.value), "?")
 
     @staticmethod
-    def create_mini_card(card: Card, index: int, color_styles: dict):
+    def create_mini_card(card: Card, index: int):
         """Create a very small card display for the discard pile preview."""
-        style = color_styles.get(card.color, color_styles[Color.RED])
-        
-        if card.color == Color.WILD:
-            card_class = "w-8 h-12 wild-card-gradient text-white rounded text-xs flex items-center justify-center border"
-        else:
-            card_class = f"w-8 h-12 {style['bg']} {style['text']} rounded text-xs flex items-center justify-center border {style['border']}"
-        
+        card_class = _MINI_CARD_CLASS.get(card.color)
+        if card_class is None:
+            if card.color == Color.WILD:
+                card_class = "uno-mini wild-card-gradient text-white"
+            else:
+                card_class = f"uno-mini uno-{card.color.name.lower()}"
+            _MINI_CARD_CLASS[card.color] = card_class
+
         with ui.card().classes(card_class):
             ui.label(CardComponents.get_mini_card_text(card)).classes("font-bold")
 
     @staticmethod
-    def create_discard_card(card: Card, play_number: int, color_styles: dict):
-        """Create a card display for the discard pile dialog."""
-        style = color_styles.get(card.color, color_styles[Color.RED])
-        
-        if card.color == Color.WILD:
-            # For wild cards in discard pile, try to show with the color it was played as
-            card_class = "w-16 h-24 wild-card-gradient text-white rounded-lg shadow flex flex-col items-center justify-center border-2 border-purple-300"
-        else:
-            card_class = f"w-16 h-24 {style['bg']} {style['text']} rounded-lg shadow flex flex-col items-center justify-center border-2 {style['border']}"
-        
-        with ui.card().classes(card_class):
-            # Play order number (small, at top)
-            ui.label(f"#{play_number}").classes("text-xs opacity-70")
-            
-            # Card display
-            ui.label(CardComponents.get_card_display_text(card)).classes("text-lg font-bold")
-            
-            # Color (small, at bottom)
-            if card.color != Color.WILD:
-                ui.label(card.color.value[:1].upper()).classes("text-xs font-semibold")
+    def discard_card_html(card: Card, play_number: int) -> str:
+        """Render one discard-pile card as an HTML snippet.
+
+        The dialog joins these into a single ui.html per batch, so a full
+        discard pile costs one DOM write instead of one widget tree per card.
+        The markup skeleton (classes and color letter) is cached per color."""
+        template = _DISCARD_CARD_TEMPLATE.get(card.color)
+        if template is None:
+            if card.color == Color.WILD:
+                # For wild cards in discard pile, try to show with the color it was played as
+                card_class = "uno-discard wild-card-gradient text-white border-purple-300"
+                color_letter = "W"
             else:
-                ui.label("W").classes("text-xs font-semibold")
+                card_class = f"uno-discard uno-{card.color.name.lower()}"
+                color_letter = card.color.value[:1].upper()
+            # Cache the bound .format so per-card rendering is one call on an
+            # already-parsed template
+            template = (
+                f'<div class="{card_class}">'
+                '<span class="text-xs opacity-70">#{n}</span>'
+                '<span class="text-lg font-bold">{text}</span>'
+                f'<span class="text-xs font-semibold">{color_letter}</span>'
+                '</div>'
+            ).format
+            _DISCARD_CARD_TEMPLATE[card.color] = template
+
+        return template(n=play_number, text=CardComponents.get_card_display_text(card))
 
 
 class DialogComponents:
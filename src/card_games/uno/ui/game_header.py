@@ -2,6 +2,9 @@
 Game header and discard pile components for UNO game interface.
 """
 
+import html
+from itertools import islice
+
 from nicegui import ui
 
 from .base import UnoUIBase
@@ -9,14 +12,27 @@ from .components import CardComponents
 from ..game import Color
 
 
+# Direction label per game.direction value - avoids rebuilding the string in
+# the binding lambda on every turn change
+_DIRECTION_TEXT = {1: "Direction: ↻", -1: "Direction: ↺"}
+
+# Memoized "<n> cards" status strings; hand sizes repeat heavily across
+# opponents and refreshes, so the hit rate is near 100%
+_COUNT_LABELS = {}
+
+
 class GameHeader:
     """Handles the game header display."""
     
     def __init__(self, ui_instance: UnoUIBase):
         self.ui = ui_instance
+        self._labels = {}  # Live label refs patched in place between rebuilds
+        self._discard_dialog = None  # Cached dialog, valid while the pile length holds
+        self._discard_dialog_len = -1
 
     def create(self):
         """Create the header with game information."""
+        self._labels = {}
         with ui.element('div').classes("game-header"):
             with ui.row().classes("w-full items-center justify-between"):
                 
@@ -30,13 +46,36 @@ class GameHeader:
                 self._create_controls()
 
     def _create_current_player_info(self):
-        """Create current player and direction display."""
+        """Create current player and direction display.
+
+        The labels are bound to the shared state, so turn changes propagate to
+        every connected client without rebuilding the header - and NiceGUI
+        skips the update entirely when the bound value is unchanged."""
         with ui.column().classes("gap-2"):
             ui.label(f"🎯 Current Turn").classes("text-lg font-semibold opacity-80")
-            ui.label(f"{self.ui.current_player}").classes("text-2xl font-bold")
-            
-            direction_icon = "↻" if self.ui.game.direction == 1 else "↺"
-            ui.label(f"Direction: {direction_icon}").classes("text-lg")
+            ui.label().bind_text_from(self.ui, 'current_player', backward=lambda v: f"{v or ''}").classes("text-2xl font-bold")
+            ui.label().bind_text_from(self.ui.game, 'direction', backward=_DIRECTION_TEXT.__getitem__).classes("text-lg")
+
+    def _other_players_html(self, player_counts) -> str:
+        """Render all opponents' card counts as a single HTML block."""
+        parts = ['<div class="flex flex-col items-end">']
+        for name, count in player_counts.items():
+            if name == self.ui.player_name:
+                continue
+            player_class = "text-lg font-bold" + (" text-yellow-300" if count == 1 else " text-white")
+            status = "🚨 UNO!" if count == 1 else _COUNT_LABELS.setdefault(count, f"{count} cards")
+            parts.append(f'<span class="{player_class}">{html.escape(name)}: {status}</span>')
+        parts.append('</div>')
+        return ''.join(parts)
+
+    def update_counts(self, player_counts=None):
+        """Patch opponent counts and the draw-pile button in place."""
+        if player_counts is None:
+            player_counts = self.ui.game.get_player_counts()
+        if 'others' in self._labels:
+            self._labels['others'].set_content(self._other_players_html(player_counts))
+        if 'draw' in self._labels:
+            self._labels['draw'].set_text(f"Draw ({len(self.ui.game.draw_pile)})")
 
     def _create_center_cards(self):
         """Create center area with top card and recent cards."""
@@ -54,36 +93,30 @@ class GameHeader:
         with ui.column().classes("gap-2 items-end"):
             ui.label("👥 Other Players").classes("text-lg font-semibold opacity-80")
             
-            # Other players info (compact)
+            # Other players info (compact) - one html block instead of one
+            # label component per opponent
             player_counts = self.ui.game.get_player_counts()
-            other_players = [(name, count) for name, count in player_counts.items() if name != self.ui.player_name]
-            
-            for name, count in other_players:
-                player_class = "text-lg font-bold" + (" text-yellow-300" if count == 1 else " text-white")
-                status = "🚨 UNO!" if count == 1 else f"{count} cards"
-                ui.label(f"{name}: {status}").classes(player_class)
-            
+            self._labels['others'] = ui.html(self._other_players_html(player_counts))
+
             # Controls row
             with ui.row().classes("items-center gap-2 mt-2"):
                 ui.label("🂠 Draw Pile").classes("text-sm opacity-80")
-                ui.button(f"Draw ({len(self.ui.game.draw_pile)})", on_click=self._draw_card).classes("bg-white/20 hover:bg-white/30 text-white font-bold py-2 px-4 rounded-lg")
+                self._labels['draw'] = ui.button(f"Draw ({len(self.ui.game.draw_pile)})", on_click=self._draw_card).classes("bg-white/20 hover:bg-white/30 text-white font-bold py-2 px-4 rounded-lg")
                 ui.button("📚 Show All Cards", on_click=self._show_discard_pile).classes("bg-white/20 hover:bg-white/30 text-white font-bold py-2 px-4 rounded-lg")
                 ui.button("🔄 Back to Lobby", on_click=self._back_to_lobby).classes("bg-white/20 hover:bg-white/30 text-white font-bold py-2 px-4 rounded-lg")
 
     def _create_header_top_card(self):
         """Create a compact top card display for the header."""
         top_card = self.ui.game.get_top_card()
-        style = self.ui.color_styles.get(top_card.color, self.ui.color_styles[Color.RED])
-        
+
         if top_card.color == Color.WILD:
             if self.ui.game.current_color:
                 # Show wild card with the chosen color as background
-                current_style = self.ui.color_styles.get(self.ui.game.current_color, self.ui.color_styles[Color.RED])
-                card_class = f"w-20 h-28 {current_style['bg']} {current_style['text']} rounded-lg shadow-lg flex flex-col items-center justify-center border-2 {current_style['border']}"
+                card_class = self.ui._header_class_by_color[self.ui.game.current_color]
             else:
-                card_class = "w-20 h-28 rounded-lg shadow-lg flex flex-col items-center justify-center border-2 border-purple-300 wild-card-gradient"
+                card_class = self.ui._header_wild_class
         else:
-            card_class = f"w-20 h-28 {style['bg']} {style['text']} rounded-lg shadow-lg flex flex-col items-center justify-center border-2 {style['border']}"
+            card_class = self.ui._header_class_by_color[top_card.color]
         
         with ui.card().classes(card_class):
             ui.label(CardComponents.get_card_display_text(top_card)).classes("text-xl font-bold")
@@ -95,39 +128,74 @@ class GameHeader:
 
     def _create_discard_pile_preview(self):
         """Create a small preview of recent cards in the discard pile."""
-        # Show last 3-4 cards (excluding the top card which is shown separately)
-        recent_cards = self.ui.game.discard_pile[-5:-1] if len(self.ui.game.discard_pile) > 4 else self.ui.game.discard_pile[:-1]
-        recent_cards.reverse()  # Show most recent first
-        
+        # Show the last 4 cards, most recent first, excluding the top card
+        # (shown separately) - reverse iteration avoids slicing out and
+        # reversing an intermediate list on every header rebuild
+        recent_cards = islice(reversed(self.ui.game.discard_pile), 1, 5)
+
         with ui.row().classes("gap-1 justify-center"):
             for i, card in enumerate(recent_cards):
-                if i >= 4:  # Limit to 4 cards max
-                    break
-                CardComponents.create_mini_card(card, i, self.ui.color_styles)
+                CardComponents.create_mini_card(card, i)
 
     def _show_discard_pile(self):
         """Show the full discard pile in a dialog."""
-        self.ui._active_dialog = True
-        
+        self.ui._dialog_event.set()
+
+        # Reopen the cached dialog as long as no new card was played since it
+        # was built - reopening costs nothing instead of re-materializing
+        # every rendered window
+        if self._discard_dialog is not None and self._discard_dialog_len == len(self.ui.game.discard_pile):
+            self._discard_dialog.open()
+            return
+
         with ui.dialog() as dialog, ui.card().classes("w-full max-w-4xl p-6"):
             ui.label("📚 All Played Cards").classes("text-2xl font-bold text-center mb-4")
             ui.label(f"Total cards played: {len(self.ui.game.discard_pile)}").classes("text-lg text-center mb-4 text-gray-600")
             
-            # Show cards in reverse order (most recent first)
-            discard_cards = list(reversed(self.ui.game.discard_pile))
-            
-            with ui.scroll_area().classes("w-full h-96"):
-                with ui.grid(columns=8).classes("gap-2 p-4"):
-                    for i, card in enumerate(discard_cards):
-                        CardComponents.create_discard_card(card, len(discard_cards) - i, self.ui.color_styles)  # Show position from start
+            # Show cards in reverse order (most recent first), but only
+            # materialize a window of cards at a time - long games can have
+            # 80+ cards and building them all up front makes the dialog crawl.
+            # The pile is appended in play order, so a card's play number is
+            # its list position + 1 and the pile is indexed from the back
+            # directly instead of copying a reversed list
+            pile = self.ui.game.discard_pile
+            total = len(pile)
+            window_size = 24  # Three grid rows per batch
+            rendered = {'count': 0}
+
+            def render_next_window():
+                start = rendered['count']
+                if start >= total:
+                    return
+                end = min(start + window_size, total)
+                # One joined ui.html per window: a single DOM write instead of
+                # a widget tree (and its websocket messages) per card
+                parts = [
+                    CardComponents.discard_card_html(pile[total - 1 - i], total - i)  # Show position from start
+                    for i in range(start, end)
+                ]
+                with batches:
+                    ui.html('<div class="grid grid-cols-8 gap-2">' + ''.join(parts) + '</div>')
+                rendered['count'] = end
+
+            def on_scroll(e):
+                # Load the next batch once the user nears the bottom
+                if e.vertical_percentage > 0.8:
+                    render_next_window()
+
+            with ui.scroll_area(on_scroll=on_scroll).classes("w-full h-96"):
+                batches = ui.column().classes("gap-2 p-4")
+                render_next_window()
             
             with ui.row().classes("w-full justify-center mt-4"):
                 def close_dialog():
-                    self.ui._active_dialog = False
+                    self.ui._dialog_event.clear()
                     dialog.close()
                 
                 ui.button("Close", on_click=close_dialog).classes("bg-blue-500 hover:bg-blue-600 text-white font-bold py-2 px-4 rounded")
-        
+
+        self._discard_dialog = dialog
+        self._discard_dialog_len = total
         dialog.open()
 
     def _draw_card(self):
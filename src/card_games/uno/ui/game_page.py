@@ -2,7 +2,9 @@
 Game page functionality for UNO game interface.
 """
 
-from nicegui import ui
+import asyncio
+
+from nicegui import ui, app
 
 from .base import UnoUIBase
 from .heartbeat import HeartbeatManager
@@ -18,7 +20,8 @@ class GamePage:
         self.game_header = GameHeader(ui_instance)
         self.card_actions = CardActions(ui_instance)
         self.hand_display = HandDisplay(ui_instance, self.card_actions)
-        
+        self._last_game_fp = None  # Fingerprint of the last rendered game state
+
         # Connect the draw card action to the header
         self.game_header._draw_card = self.card_actions.draw_card
 
@@ -34,7 +37,10 @@ class GamePage:
             self.ui.game_stage = 'landing'
             ui.navigate.to('/')
             return
-        
+
+        # Force a full render for a freshly shown page
+        self._last_game_fp = None
+
         with ui.column().classes("w-full min-h-screen bg-gradient-to-br from-blue-50 to-indigo-50"):
             
             # Game header container (will be updated)
@@ -47,7 +53,7 @@ class GamePage:
                 """Update the entire game display."""
                 # Send heartbeat for current player
                 HeartbeatManager.send_heartbeat(self.ui.player_name)
-                if self.ui._active_dialog:
+                if self.ui._dialog_event.is_set():
                     return
                 
                 # Check for game over first
@@ -58,40 +64,153 @@ class GamePage:
                 # Update current player
                 if self.ui.game:
                     self.ui.current_player = self.ui.game.get_current_player()
-                
-                # Clear and rebuild header
-                game_header_container.clear()
-                with game_header_container:
-                    self.game_header.create()
-                
-                # Clear and rebuild main content
-                main_content_container.clear()
-                with main_content_container:
-                    self._create_main_content()
+
+                # Snapshot game state once per refresh - every fingerprint,
+                # label and patch helper below reuses it instead of
+                # re-traversing the game per read
+                game = self.ui.game
+                hand = game.get_player_hand(self.ui.player_name)
+                top_card = game.get_top_card()
+                player_counts = game.get_player_counts()
+
+                # Refresh the playability mask once per tick; the per-card
+                # checks during render are then simple set lookups
+                self.card_actions.recompute_playable(hand)
+
+                # Skip the refresh entirely when nothing visible changed -
+                # a single poll tick would otherwise wipe and recreate every
+                # card, the header, and the status labels
+
+                # Counts, draw pile and turn labels are patched/bound in place,
+                # so only structural header changes force a rebuild
+                header_fp = (
+                    (top_card.color, top_card.type, top_card.value),
+                    len(game.discard_pile),
+                    game.current_color,
+                )
+                hand_fp = (
+                    self.ui.player_name,
+                    tuple(id(c) for c in hand),
+                    self.ui.current_player,
+                    game.forced_draw,
+                )
+                fingerprint = (
+                    header_fp,
+                    hand_fp,
+                    tuple(player_counts.items()),
+                    len(game.draw_pile),
+                    game.direction,
+                )
+                if fingerprint == self._last_game_fp:
+                    return
+                prev_header_fp, prev_hand_fp = (self._last_game_fp or (None, None))[:2]
+                first_render = self._last_game_fp is None
+                self._last_game_fp = fingerprint
+
+                # Patch the header labels in place for a simple turn change;
+                # only rebuild the header when cards/counts actually moved
+                if first_render or header_fp != prev_header_fp:
+                    game_header_container.clear()
+                    with game_header_container:
+                        self.game_header.create()
+                else:
+                    self.game_header.update_counts(player_counts)
+
+                if first_render:
+                    main_content_container.clear()
+                    with main_content_container:
+                        self._create_main_content(hand)
+                elif hand_fp != prev_hand_fp:
+                    self._update_main_content(hand)
             
             # Initial display
             update_game_display()
 
-            # Auto-refresh 
-            ui.timer(2.0, update_game_display)
+            # Push-driven refresh: wake on shared-state bumps instead of
+            # rebuilding on a fixed 2-second poll; the wait timeout keeps
+            # heartbeats flowing between moves
+            client = ui.context.client
+            stopped = {'flag': False}
+            name = self.ui.player_name
+
+            async def watch_state():
+                version = UnoUIBase._state_version
+                while not stopped['flag']:
+                    version = await UnoUIBase.wait_for_state_change(version)
+                    if stopped['flag']:
+                        break
+                    # Enter the client context: this task has no slot stack
+                    # of its own (unlike the old ui.timer callback), and the
+                    # game-over branch navigates, which needs to resolve the
+                    # client from the current task. A failed refresh is
+                    # reported like timer callback errors were and must not
+                    # kill the watcher - it also keeps the heartbeats alive
+                    try:
+                        with client:
+                            update_game_display()
+                    except Exception as e:
+                        app.handle_exception(e)
+
+            def on_connect():
+                # Reconnects fire this without re-running the page function,
+                # so clear the stop flag left behind by the last disconnect
+                # before starting the new watcher
+                stopped['flag'] = False
+                # While the session is open the reaper must not evict us
+                UnoUIBase._connected_players.add(name)
+                asyncio.create_task(watch_state())
+
+            def on_disconnect():
+                stopped['flag'] = True
+                UnoUIBase._connected_players.discard(name)
 
-    def _create_main_content(self):
-        """Create the main game content area."""
+            client.on_connect(on_connect)
+            client.on_disconnect(on_disconnect)
+
+    def _create_main_content(self, hand):
+        """Create the main game content area.
+
+        Status labels, the hand-count label and the hand row live in their own
+        containers so later updates can patch just the part that changed."""
         with ui.column().classes("flex-grow p-6"):
-            # Player status
-            is_my_turn = self.ui.current_player == self.ui.player_name
-            if is_my_turn:
-                ui.label(f"🎯 Your Turn, {self.ui.player_name}!").classes("text-3xl font-bold text-center mb-6 text-green-600 animate-pulse")
-                
-                # Show forced draw warning for current player
-                if self.ui.game.forced_draw > 0:
-                    ui.label(f"⚠️ You must draw {self.ui.game.forced_draw} cards or play +2 to stack!").classes("text-xl font-bold text-center mb-4 text-red-600 bg-red-100 p-3 rounded-lg")
-            else:
-                ui.label(f"🕐 Waiting for {self.ui.current_player}'s turn...").classes("text-2xl font-bold text-center mb-6 text-gray-600")
-            
+            # Player status - permanent labels patched in place, so the pulse
+            # animation is not restarted from t=0 by every refresh
+            self._status_label = ui.label().classes("text-2xl font-bold text-center mb-6 text-gray-600")
+            self._forced_draw_label = ui.label().classes("text-xl font-bold text-center mb-4 text-red-600 bg-red-100 p-3 rounded-lg")
+            self._update_status_labels()
+
             # Player's hand
-            ui.label(f"🎴 Your Hand ({len(self.ui.game.get_player_hand(self.ui.player_name))} cards)").classes("text-xl font-bold mb-4")
-            self.hand_display.create_horizontal_hand()
+            self._hand_count_label = ui.label(f"🎴 Your Hand ({len(hand)} cards)").classes("text-xl font-bold mb-4")
+            self._hand_container = ui.column().classes("w-full")
+            with self._hand_container:
+                self.hand_display.create_horizontal_hand(hand)
+
+    def _update_status_labels(self):
+        """Patch the turn status (and forced-draw warning) labels in place."""
+        is_my_turn = self.ui.current_player == self.ui.player_name
+        if is_my_turn:
+            self._status_label.set_text(f"🎯 Your Turn, {self.ui.player_name}!")
+            self._status_label.classes(replace="text-3xl font-bold text-center mb-6 text-green-600 animate-pulse")
+        else:
+            self._status_label.set_text(f"🕐 Waiting for {self.ui.current_player}'s turn...")
+            self._status_label.classes(replace="text-2xl font-bold text-center mb-6 text-gray-600")
+
+        # Show forced draw warning for current player
+        show_warning = is_my_turn and self.ui.game.forced_draw > 0
+        if show_warning:
+            self._forced_draw_label.set_text(f"⚠️ You must draw {self.ui.game.forced_draw} cards or play +2 to stack!")
+        self._forced_draw_label.set_visibility(show_warning)
+
+    def _update_main_content(self, hand):
+        """Refresh the status area and patch the hand in place when possible."""
+        self._update_status_labels()
+
+        self._hand_count_label.set_text(f"🎴 Your Hand ({len(hand)} cards)")
+
+        if not self.hand_display.patch_hand(hand):
+            self._hand_container.clear()
+            with self._hand_container:
+                self.hand_display.create_horizontal_hand(hand)
 
     def _show_winner_page(self):
         """Display winner page."""
@@ -133,6 +252,7 @@ class GamePage:
         UnoUIBase._player_heartbeats.clear()
         UnoUIBase._game_started = False
         UnoUIBase._game_hash = None
+        UnoUIBase.bump_state()
         # Redirect to landing page
         ui.navigate.to('/')
 
@@ -145,4 +265,5 @@ class GamePage:
         # Reset all players to not ready but keep heartbeats
         for player in UnoUIBase._lobby_players:
             UnoUIBase._lobby_players[player] = False
+        UnoUIBase.bump_state()
         ui.navigate.to('/lobby')
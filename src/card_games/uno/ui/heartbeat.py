@@ -2,53 +2,103 @@
 Heartbeat system and player management for UNO game interface.
 """
 
+import asyncio
+import heapq
 import time
+from bisect import bisect_right
 from nicegui import ui
 
 from .base import UnoUIBase
 
+# Bucket thresholds derived from the timeout once at import time instead of
+# recomputing the fractions for every player on every refresh; the bucket is
+# the index of the first threshold the heartbeat age has crossed
+_CONN_THRESHOLDS = (UnoUIBase._heartbeat_timeout * 0.4, UnoUIBase._heartbeat_timeout * 0.7)
+_CONN_TABLE = (("🟢", "Connected"), ("🟡", "Weak Connection"), ("🔴", "Poor Connection"))
+
+# Coalesce heartbeat writes: every refresh calls send_heartbeat, but a
+# recorded heartbeat only needs to land every few seconds - 5s gives 6x
+# headroom against the 30s inactivity timeout while skipping most of the
+# lock/dict/heap traffic
+_HEARTBEAT_INTERVAL = 5
+_last_sent = {}  # {player_name: timestamp of the last recorded heartbeat}
+
+# Seconds between background eviction sweeps
+_REAPER_INTERVAL = 5
+
 
 class HeartbeatManager:
     """Manages player heartbeats and inactive player removal."""
-    
+
+    _reaper_task = None  # The single per-process eviction task
+
+    @classmethod
+    def start_reaper(cls):
+        """Start the background eviction sweep (idempotent, once per process).
+
+        One task sweeps for everyone, so clients no longer race each other
+        evicting the same players from inside their refresh handlers."""
+        if cls._reaper_task is None:
+            cls._reaper_task = asyncio.create_task(cls._reap_loop())
+
+    @classmethod
+    async def _reap_loop(cls):
+        while True:
+            await asyncio.sleep(_REAPER_INTERVAL)
+            cls.remove_inactive_players()
+
     @staticmethod
     def send_heartbeat(player_name: str):
         """Send heartbeat for current player to show they're still active."""
-        if player_name:
-            UnoUIBase._player_heartbeats[player_name] = time.time()
+        if not player_name:
+            return
+        now = time.time()
+        if now - _last_sent.get(player_name, 0) < _HEARTBEAT_INTERVAL:
+            return  # A recent heartbeat is already on record
+        _last_sent[player_name] = now
+        with UnoUIBase._lock:
+            UnoUIBase._player_heartbeats[player_name] = now
+            heapq.heappush(UnoUIBase._heartbeat_heap, (now, player_name))
 
     @staticmethod
     def remove_inactive_players():
-        """Remove players who haven't sent a heartbeat in the timeout period."""
-        current_time = time.time()
+        """Remove players who haven't sent a heartbeat in the timeout period.
+
+        The heap keeps the oldest heartbeat on top, so the sweep only touches
+        entries that actually expired instead of scanning every player. Each
+        new heartbeat pushes a fresh entry; superseded ones are recognized by
+        their stale timestamp and dropped on the way out."""
+        cutoff = time.time() - UnoUIBase._heartbeat_timeout
         inactive_players = []
-        
-        for player_name, last_heartbeat in UnoUIBase._player_heartbeats.items():
-            if current_time - last_heartbeat > UnoUIBase._heartbeat_timeout:
+
+        with UnoUIBase._lock:
+            heap = UnoUIBase._heartbeat_heap
+            while heap and heap[0][0] < cutoff:
+                timestamp, player_name = heapq.heappop(heap)
+                if UnoUIBase._player_heartbeats.get(player_name) != timestamp:
+                    continue  # A newer heartbeat superseded this entry
+                if player_name in UnoUIBase._connected_players:
+                    continue  # Session still open - never evict a live player
+                UnoUIBase._lobby_players.pop(player_name, None)
+                UnoUIBase._player_heartbeats.pop(player_name, None)
+                _last_sent.pop(player_name, None)  # Rejoin writes immediately
                 inactive_players.append(player_name)
-        
-        for player_name in inactive_players:
-            if player_name in UnoUIBase._lobby_players:
-                del UnoUIBase._lobby_players[player_name]
-            if player_name in UnoUIBase._player_heartbeats:
-                del UnoUIBase._player_heartbeats[player_name]
-            
-            # Don't show notification for every inactive player removal
-            # as it could be noisy - just clean them up silently
-        
+
+                # Don't show notification for every inactive player removal
+                # as it could be noisy - just clean them up silently
+
+        if inactive_players:
+            UnoUIBase.bump_state()
         return len(inactive_players) > 0  # Return True if any players were removed
 
     @staticmethod
-    def get_connection_status(player_name: str) -> tuple:
-        """Get connection status for a player."""
-        current_time = time.time()
+    def get_connection_bucket(player_name: str) -> int:
+        """Get the connection bucket for a player: 0=good, 1=weak, 2=poor."""
         last_heartbeat = UnoUIBase._player_heartbeats.get(player_name, 0)
-        time_since_heartbeat = current_time - last_heartbeat
-        
-        # Add connection indicator
-        if time_since_heartbeat > UnoUIBase._heartbeat_timeout * 0.7:  # 70% of timeout
-            return "🔴", "Poor Connection"  # Red for poor connection
-        elif time_since_heartbeat > UnoUIBase._heartbeat_timeout * 0.4:  # 40% of timeout
-            return "🟡", "Weak Connection"  # Yellow for weak connection
-        else:
-            return "🟢", "Connected"  # Green for good connection
+        time_since_heartbeat = time.time() - last_heartbeat
+        return bisect_right(_CONN_THRESHOLDS, time_since_heartbeat)
+
+    @staticmethod
+    def get_connection_status(player_name: str) -> tuple:
+        """Get connection (icon, text) for a player."""
+        return _CONN_TABLE[HeartbeatManager.get_connection_bucket(player_name)]
@@ -42,15 +42,20 @@ class LandingPage:
                         ui.notify("Please enter your name!", type='warning')
                         return
                     
-                    if name in UnoUIBase._lobby_players:
-                        ui.notify("Name already taken! Choose another name.", type='warning')
-                        return
-                    
-                    # Add player to lobby
+                    # Check and insert under the lock so two clients joining
+                    # with the same name at once cannot both pass the check
+                    with UnoUIBase._lock:
+                        if name in UnoUIBase._lobby_players:
+                            ui.notify("Name already taken! Choose another name.", type='warning')
+                            return
+
+                        # Add player to lobby
+                        UnoUIBase._lobby_players[name] = False  # Not ready yet
+
                     self.ui.player_name = name
-                    UnoUIBase._lobby_players[name] = False  # Not ready yet
                     HeartbeatManager.send_heartbeat(name)  # Initialize heartbeat
                     self.ui.game_stage = 'lobby'
+                    UnoUIBase.bump_state()
                     
                     ui.notify(f"Welcome {name}! Joining lobby...", type='positive')
                     # Navigate to lobby page
@@ -2,9 +2,9 @@
 Lobby page functionality for UNO game interface.
 """
 
-import hashlib
-import time
-from nicegui import ui
+import asyncio
+import secrets
+from nicegui import ui, app
 
 from .base import UnoUIBase
 from .heartbeat import HeartbeatManager
@@ -12,18 +12,45 @@ from .components import DialogComponents
 from ..game import UnoGame
 
 
+# Precomputed per-row display presets keyed by (ready, connection_bucket):
+# (status icon, status text, status css, connection icon, connection text)
+_ROW_PRESETS = {
+    (ready, bucket): (
+        "✅" if ready else "⏳",
+        "Ready" if ready else "Not Ready",
+        "text-lg text-green-600" if ready else "text-lg text-orange-600",
+        ("🟢", "🟡", "🔴")[bucket],
+        ("Connected", "Weak Connection", "Poor Connection")[bucket],
+    )
+    for ready in (False, True)
+    for bucket in (0, 1, 2)
+}
+
+# Fully assembled ready-button class strings - picked by ternary instead of
+# re-interpolating the shared Tailwind boilerplate on every rebuild
+_READY_BTN_CLS = "p-3 text-lg font-bold bg-red-500 hover:bg-red-600 text-white transition-all duration-300"
+_NOT_READY_BTN_CLS = "p-3 text-lg font-bold bg-green-500 hover:bg-green-600 text-white transition-all duration-300"
+
+
 class LobbyPage:
     """Handles the lobby page where players ready up and start games."""
     
     def __init__(self, ui_instance: UnoUIBase):
         self.ui = ui_instance
+        self._last_lobby_fp = None  # Fingerprint of the last rendered lobby state
+        self._rows_container = None  # Column holding one row per lobby player
+        self._row_elements = {}  # {player: [row, status_label, conn_label, state]}
 
     def show(self):
         """Stage 2: Lobby page - Show players and ready status."""
         # Ensure current player is in the lobby dict
-        if self.ui.player_name and self.ui.player_name not in UnoUIBase._lobby_players:
-            UnoUIBase._lobby_players[self.ui.player_name] = False
+        with UnoUIBase._lock:
+            missing = self.ui.player_name and self.ui.player_name not in UnoUIBase._lobby_players
+            if missing:
+                UnoUIBase._lobby_players[self.ui.player_name] = False
+        if missing:
             HeartbeatManager.send_heartbeat(self.ui.player_name)
+            UnoUIBase.bump_state()
             
         with ui.column().classes("w-full min-h-screen bg-gradient-to-br from-purple-50 to-pink-50 p-4"):
             with ui.card().classes("w-full max-w-2xl mx-auto p-8 bg-white/90 backdrop-blur-sm shadow-2xl"):
@@ -51,16 +78,18 @@ class LobbyPage:
                 def clear_lobby():
                     """Clear all players from lobby with confirmation."""
                     def confirm_clear():
-                        UnoUIBase._lobby_players.clear()
-                        UnoUIBase._player_heartbeats.clear()
+                        with UnoUIBase._lock:
+                            UnoUIBase._lobby_players.clear()
+                            UnoUIBase._player_heartbeats.clear()
+                        UnoUIBase.bump_state()
                         ui.notify("Cleared all players from lobby", type='info')
-                        self.ui._active_dialog = False
+                        self.ui._dialog_event.clear()
                         update_lobby_display()
                     
                     def cancel_clear():
-                        self.ui._active_dialog = False
+                        self.ui._dialog_event.clear()
                     
-                    self.ui._active_dialog = True
+                    self.ui._dialog_event.set()
                     dialog = DialogComponents.create_confirmation_dialog(
                         "Clear all players from lobby?",
                         "This will remove all players including yourself.",
@@ -71,74 +100,155 @@ class LobbyPage:
                 
                 def update_lobby_display():
                     """Update the lobby display with current players."""
-                    # Send heartbeat for current player
+                    # Send heartbeat for current player; eviction of stale
+                    # players happens in the background reaper task, not here
                     HeartbeatManager.send_heartbeat(self.ui.player_name)
-                    
-                    # Remove inactive players
-                    players_removed = HeartbeatManager.remove_inactive_players()
-                    
-                    # Safety check: if current player was removed, re-add them
-                    if self.ui.player_name and self.ui.player_name not in UnoUIBase._lobby_players:
-                        UnoUIBase._lobby_players[self.ui.player_name] = False
-                        HeartbeatManager.send_heartbeat(self.ui.player_name)
-                        ui.notify(f"Re-added {self.ui.player_name} to lobby", type='info')
-                    
-                    players_container.clear()
-                    ready_button_container.clear()
-                    start_button_container.clear()
-                    
-                    self._create_players_list(players_container)
-                    self._create_ready_button(ready_button_container, update_lobby_display)
-                    self._create_start_button(start_button_container, clear_lobby)
+
+                    # Walk the lobby dict once and derive everything the
+                    # render needs from that single pass
+                    items = sorted(UnoUIBase._lobby_players.items())
+                    ready_count = sum(1 for _, ready in items if ready)
+                    not_ready_names = [name for name, ready in items if not ready]
+                    total = len(items)
+
+                    # Skip the rebuild entirely when the lobby looks exactly the same
+                    # (same players, same ready states, same connection buckets)
+                    fingerprint = (
+                        tuple(items),
+                        tuple((name, HeartbeatManager.get_connection_bucket(name))
+                              for name, _ in items),
+                    )
+                    if fingerprint == self._last_lobby_fp:
+                        return
+                    first_render = self._last_lobby_fp is None
+                    self._last_lobby_fp = fingerprint
+
+                    self._patch_players_list(players_container)
+
+                    # The buttons are refreshable subtrees: NiceGUI re-emits
+                    # just them in place instead of clear()-and-rebuild
+                    if first_render:
+                        with ready_button_container:
+                            self._create_ready_button(update_lobby_display)
+                        with start_button_container:
+                            self._create_start_button(clear_lobby, ready_count,
+                                                      not_ready_names, total)
+                    else:
+                        self._create_ready_button.refresh(update_lobby_display)
+                        self._create_start_button.refresh(clear_lobby, ready_count,
+                                                          not_ready_names, total)
 
                 # Initial display
                 update_lobby_display()
-                
-                # Auto-refresh every 2 seconds
-                ui.timer(2.0, update_lobby_display)
-
-    def _create_players_list(self, container):
-        """Create the players list display."""
-        with container:
-            ui.label("Players in Lobby:").classes("text-xl font-bold mb-4")
-            ui.label(f"⏰ Auto-remove inactive players after {UnoUIBase._heartbeat_timeout} seconds").classes("text-sm text-gray-500 mb-4")
-            
-            for player, ready in UnoUIBase._lobby_players.items():
-                status_icon = "✅" if ready else "⏳"
-                status_text = "Ready" if ready else "Not Ready"
-                color_class = "text-green-600" if ready else "text-orange-600"
-                
-                # Check connection status
-                connection_icon, connection_text = HeartbeatManager.get_connection_status(player)
-                
-                # Create a row for each player with status and remove button
-                with ui.row().classes("w-full items-center justify-between mb-2 p-2 bg-gray-50 rounded-lg"):
-                    with ui.column().classes("flex-grow"):
-                        ui.label(f"{status_icon} {player} - {status_text}").classes(f"text-lg {color_class}")
-                        ui.label(f"{connection_icon} {connection_text}").classes("text-xs text-gray-500")
-                    
-                    # Remove button (only for other players, not yourself)
-                    if player != self.ui.player_name:
-                        self._create_remove_button(player)
-                    else:
-                        # Empty space to maintain alignment
-                        ui.label("").classes("w-16")
+
+                # Push-driven refresh: wake on shared-state bumps instead of
+                # rebuilding on a fixed 2-second poll; the wait timeout keeps
+                # heartbeats flowing while the lobby is quiet
+                client = ui.context.client
+                stopped = {'flag': False}
+                name = self.ui.player_name
+
+                async def watch_state():
+                    version = UnoUIBase._state_version
+                    while not stopped['flag']:
+                        version = await UnoUIBase.wait_for_state_change(version)
+                        if stopped['flag']:
+                            break
+                        # Enter the client context: this task has no slot
+                        # stack of its own, and the refresh can notify when
+                        # a stale player gets removed. A failed refresh is
+                        # reported like timer callback errors were and must
+                        # not kill the watcher - it also keeps the
+                        # heartbeats alive
+                        try:
+                            with client:
+                                update_lobby_display()
+                        except Exception as e:
+                            app.handle_exception(e)
+
+                def on_connect():
+                    # Reconnects fire this without re-running the page
+                    # function, so clear the stop flag left behind by the
+                    # last disconnect before starting the new watcher
+                    stopped['flag'] = False
+                    # While the session is open the reaper must not evict us
+                    UnoUIBase._connected_players.add(name)
+                    asyncio.create_task(watch_state())
+
+                def on_disconnect():
+                    stopped['flag'] = True
+                    UnoUIBase._connected_players.discard(name)
+
+                client.on_connect(on_connect)
+                client.on_disconnect(on_disconnect)
+
+    def _patch_players_list(self, container):
+        """Diff the lobby rows against the previous render and patch in place.
+
+        Rows are keyed by player name: players who left get their row deleted,
+        new players get a fresh row, and everyone else has their status labels
+        updated with set_text - no container.clear() churn per refresh."""
+        if self._rows_container is None:
+            with container:
+                ui.label("Players in Lobby:").classes("text-xl font-bold mb-4")
+                ui.label(f"⏰ Auto-remove inactive players after {UnoUIBase._heartbeat_timeout} seconds").classes("text-sm text-gray-500 mb-4")
+                self._rows_container = ui.column().classes("w-full")
+
+        current = {
+            player: (ready, HeartbeatManager.get_connection_bucket(player))
+            for player, ready in UnoUIBase._lobby_players.items()
+        }
+
+        # Players who left the lobby
+        for player in list(self._row_elements.keys() - current.keys()):
+            self._row_elements.pop(player)[0].delete()
+
+        for player, state in current.items():
+            entry = self._row_elements.get(player)
+            if entry is None:
+                with self._rows_container:
+                    self._row_elements[player] = self._create_player_row(player, state)
+            elif entry[3] != state:
+                status_icon, status_text, status_class, connection_icon, connection_text = _ROW_PRESETS[state]
+                entry[1].set_text(f"{status_icon} {player} - {status_text}")
+                entry[1].classes(replace=status_class)
+                entry[2].set_text(f"{connection_icon} {connection_text}")
+                entry[3] = state
+
+    def _create_player_row(self, player: str, state):
+        """Create a row for one player with status and remove button."""
+        # Look up all row styling in one precomputed table
+        status_icon, status_text, status_class, connection_icon, connection_text = _ROW_PRESETS[state]
+
+        with ui.row().classes("w-full items-center justify-between mb-2 p-2 bg-gray-50 rounded-lg") as row:
+            with ui.column().classes("flex-grow"):
+                status_label = ui.label(f"{status_icon} {player} - {status_text}").classes(status_class)
+                conn_label = ui.label(f"{connection_icon} {connection_text}").classes("text-xs text-gray-500")
+
+            # Remove button (only for other players, not yourself)
+            if player != self.ui.player_name:
+                self._create_remove_button(player)
+            else:
+                # Empty space to maintain alignment
+                ui.label("").classes("w-16")
+
+        return [row, status_label, conn_label, state]
 
     def _create_remove_button(self, player_to_remove: str):
         """Create remove button for a player."""
         def remove_player():
             def confirm_remove():
-                if player_to_remove in UnoUIBase._lobby_players:
-                    del UnoUIBase._lobby_players[player_to_remove]
-                if player_to_remove in UnoUIBase._player_heartbeats:
-                    del UnoUIBase._player_heartbeats[player_to_remove]
+                with UnoUIBase._lock:
+                    UnoUIBase._lobby_players.pop(player_to_remove, None)
+                    UnoUIBase._player_heartbeats.pop(player_to_remove, None)
+                UnoUIBase.bump_state()
                 ui.notify(f"Removed {player_to_remove} from lobby", type='info')
-                self.ui._active_dialog = False
+                self.ui._dialog_event.clear()
             
             def cancel_remove():
-                self.ui._active_dialog = False
+                self.ui._dialog_event.clear()
             
-            self.ui._active_dialog = True
+            self.ui._dialog_event.set()
             dialog = DialogComponents.create_confirmation_dialog(
                 f"Remove {player_to_remove} from lobby?",
                 None,
@@ -152,71 +262,75 @@ class LobbyPage:
             on_click=remove_player
         ).classes("bg-red-400 hover:bg-red-500 text-white text-sm px-2 py-1 rounded")
 
-    def _create_ready_button(self, container, update_callback):
+    @ui.refreshable
+    def _create_ready_button(self, update_callback):
         """Create the ready button for the current player."""
-        with container:
-            current_ready = UnoUIBase._lobby_players.get(self.ui.player_name, False)
-            
-            def toggle_ready():
-                # Ensure player is in lobby dict
-                if self.ui.player_name not in UnoUIBase._lobby_players:
-                    UnoUIBase._lobby_players[self.ui.player_name] = False
-                
-                UnoUIBase._lobby_players[self.ui.player_name] = not UnoUIBase._lobby_players[self.ui.player_name]
-                ui.notify(f"You are {'ready' if UnoUIBase._lobby_players[self.ui.player_name] else 'not ready'}!", type='positive')
-                update_callback()
-            
-            button_text = "❌ Not Ready" if current_ready else "✅ Ready Up"
-            button_class = "bg-red-500 hover:bg-red-600" if current_ready else "bg-green-500 hover:bg-green-600"
-            
-            ui.button(
-                button_text,
-                on_click=toggle_ready
-            ).classes(f"p-3 text-lg font-bold {button_class} text-white transition-all duration-300")
-
-    def _create_start_button(self, container, clear_lobby_callback):
-        """Create the start game button."""
-        with container:
-            ready_players = [name for name, ready in UnoUIBase._lobby_players.items() if ready]
-            
-            if len(ready_players) >= 2 and len(ready_players) == len(UnoUIBase._lobby_players):
-                def start_game():
+        current_ready = UnoUIBase._lobby_players.get(self.ui.player_name, False)
+
+        def toggle_ready():
+            with UnoUIBase._lock:
+                # Connected players can no longer be evicted mid-session, so
+                # the old "re-add if missing" branch is gone; .get covers a
+                # manual removal racing the click
+                UnoUIBase._lobby_players[self.ui.player_name] = not UnoUIBase._lobby_players.get(self.ui.player_name, False)
+            UnoUIBase.bump_state()
+            ui.notify(f"You are {'ready' if UnoUIBase._lobby_players[self.ui.player_name] else 'not ready'}!", type='positive')
+            update_callback()
+
+        button_text = "❌ Not Ready" if current_ready else "✅ Ready Up"
+
+        ui.button(
+            button_text,
+            on_click=toggle_ready
+        ).classes(_READY_BTN_CLS if current_ready else _NOT_READY_BTN_CLS)
+
+    @ui.refreshable
+    def _create_start_button(self, clear_lobby_callback,
+                             ready_count, not_ready_names, total):
+        """Create the start game button from precomputed lobby stats."""
+        if ready_count >= 2 and ready_count == total:
+            def start_game():
+                with UnoUIBase._lock:
+                    # Two clients clicking Start at once must not build
+                    # two UnoGame instances
+                    if UnoUIBase._game_started:
+                        return
+
                     # Create game with ready players
                     player_names = list(UnoUIBase._lobby_players.keys())
                     self.ui.game = UnoGame(player_names)
                     UnoUIBase._game_started = True
                     self.ui.current_player = self.ui.game.get_current_player()
-                    
-                    # Generate unique game hash
-                    game_data = f"{'-'.join(sorted(player_names))}-{int(time.time())}"
-                    UnoUIBase._game_hash = hashlib.md5(game_data.encode()).hexdigest()[:8]
-                    
-                    self.ui.game_stage = 'game'
-                    
-                    ui.notify("Game starting!", type='positive')
-                    ui.navigate.to(f'/uno-{UnoUIBase._game_hash}')  # Navigate to game page
-                
-                ui.button(
-                    f"🎮 Start Game ({len(ready_players)} players)",
-                    on_click=start_game
-                ).classes("p-4 text-xl font-bold bg-gradient-to-r from-blue-500 to-purple-500 text-white hover:from-blue-600 hover:to-purple-600 transition-all duration-300")
-            
-            elif len(UnoUIBase._lobby_players) < 2:
-                ui.label("Need at least 2 players to start").classes("text-lg text-gray-600 italic")
-                
-                # Add clear lobby button if there are players but not enough
-                if len(UnoUIBase._lobby_players) > 0:
-                    ui.button(
-                        "🧹 Clear All Players",
-                        on_click=clear_lobby_callback
-                    ).classes("p-2 text-sm font-bold bg-gray-400 hover:bg-gray-500 text-white transition-all duration-300 mt-2")
-            
-            else:
-                not_ready = [name for name, ready in UnoUIBase._lobby_players.items() if not ready]
-                ui.label(f"Waiting for: {', '.join(not_ready)}").classes("text-lg text-orange-600")
-                
-                # Add clear lobby button for lobby management
+
+                    # Generate unguessable game URL slug
+                    UnoUIBase._game_hash = secrets.token_urlsafe(6)
+
+                self.ui.game_stage = 'game'
+                UnoUIBase.bump_state()
+
+                ui.notify("Game starting!", type='positive')
+                ui.navigate.to(f'/uno-{UnoUIBase._game_hash}')  # Navigate to game page
+
+            ui.button(
+                f"🎮 Start Game ({ready_count} players)",
+                on_click=start_game
+            ).classes("p-4 text-xl font-bold bg-gradient-to-r from-blue-500 to-purple-500 text-white hover:from-blue-600 hover:to-purple-600 transition-all duration-300")
+
+        elif total < 2:
+            ui.label("Need at least 2 players to start").classes("text-lg text-gray-600 italic")
+
+            # Add clear lobby button if there are players but not enough
+            if total > 0:
                 ui.button(
                     "🧹 Clear All Players",
                     on_click=clear_lobby_callback
                 ).classes("p-2 text-sm font-bold bg-gray-400 hover:bg-gray-500 text-white transition-all duration-300 mt-2")
+
+        else:
+            ui.label(f"Waiting for: {', '.join(not_ready_names)}").classes("text-lg text-orange-600")
+
+            # Add clear lobby button for lobby management
+            ui.button(
+                "🧹 Clear All Players",
+                on_click=clear_lobby_callback
+            ).classes("p-2 text-sm font-bold bg-gray-400 hover:bg-gray-500 text-white transition-all duration-300 mt-2")
@@ -2,9 +2,11 @@
 Main UNO UI class and application routing.
 """
 
-from nicegui import ui
+from nicegui import app, ui
+from starlette.responses import RedirectResponse
 
 from .base import UnoUIBase
+from .heartbeat import HeartbeatManager
 from .styles import UnoStyles
 from .landing import LandingPage
 from .lobby import LobbyPage
@@ -21,42 +23,43 @@ class UnoUI(UnoUIBase):
         
         # Set up custom CSS
         UnoStyles.setup_custom_css()
-        
-        # Initialize page handlers
-        self.landing_page = LandingPage(self)
-        self.lobby_page = LobbyPage(self)
-        self.game_page = GamePage(self)
 
     def run(self, title: str = "🎮 UNO Game", port: int = 8080, debug: bool = False):
         """Run the UI application."""
         if ui is None:
             raise ImportError("NiceGUI is required for the UI. Install with: pip install nicegui")
         
-        # Set up page routes for proper session handling
+        # One background task evicts inactive players for all clients
+        app.on_startup(HeartbeatManager.start_reaper)
+
+        # Set up page routes for proper session handling; page handlers are
+        # constructed per request so element refs they hold never leak
+        # across sessions
         @ui.page('/')
         def index_page():
             # Landing page - player name entry
-            self.landing_page.show()
-        
+            LandingPage(self).show()
+
         @ui.page('/lobby')
         def lobby_page():
-            # Check if player has entered name
+            # Check if player has entered name - redirect at the HTTP level
+            # instead of building a page that immediately navigates away
             if not self.player_name:
-                ui.navigate.to('/')
-                return
-            self.lobby_page.show()
-        
+                return RedirectResponse('/', status_code=302)
+            LobbyPage(self).show()
+
         @ui.page('/uno-{game_hash}')
         def game_page(game_hash: str):
-            # Check if player is part of this game session
+            # Check if player is part of this game session - redirect at the
+            # HTTP level so no elements are built for a stale or bogus hash
             if not self.player_name or not UnoUIBase._game_started or UnoUIBase._game_hash != game_hash:
-                ui.navigate.to('/lobby')
-                return
-            
+                return RedirectResponse('/lobby', status_code=302)
+
+            page = GamePage(self)
             if self.game and self.game.is_game_over():
-                self.game_page._show_winner_page()
+                page._show_winner_page()
             else:
-                self.game_page.show()
+                page.show()
         
         # Run the application
         ui.run(
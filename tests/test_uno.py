@@ -2,15 +2,17 @@
 Basic tests for the Uno game implementation.
 """
 
-import sys
-from pathlib import Path
 import unittest
 
-# Add the src directory to the path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+try:
+    from card_games import UnoGame, Card, Color, CardType
+except ImportError:
+    # Fall back to the in-repo sources when the package is not installed
+    import sys
+    from pathlib import Path
 
-from card_games import UnoGame, Card, Color, CardType
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from card_games import UnoGame, Card, Color, CardType
 
 
 class TestUnoGame(unittest.TestCase):